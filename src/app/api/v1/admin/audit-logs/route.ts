@@ -1,12 +1,22 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { db } from '@/lib/db'
 import { withAdminAuth, AuthenticatedRequest } from '@/lib/middleware'
+import { querySchemas } from '@/lib/validations'
 
 async function handler(req: AuthenticatedRequest) {
   try {
     const { searchParams } = new URL(req.url)
-    const page = parseInt(searchParams.get('page') || '1')
-    const limit = parseInt(searchParams.get('limit') || '50')
+
+    // Bound the page size so a single request cannot pull the whole log
+    const queryValidation = querySchemas.auditLogs.safeParse(Object.fromEntries(searchParams))
+    if (!queryValidation.success) {
+      return NextResponse.json(
+        { error: 'Invalid query parameters', details: queryValidation.error.errors },
+        { status: 400 }
+      )
+    }
+
+    const { page, limit } = queryValidation.data
     const offset = (page - 1) * limit
 
     const [logs, total] = await Promise.all([
@@ -3,6 +3,8 @@ import { db } from '@/lib/db'
 import { AuthenticatedRequest, withAdminAuth } from '@/lib/middleware'
 import { computePayloadChecksum, createIngestionSchema } from '@/lib/standards-registry'
 
+const INGESTION_TRANSACTION_TIMEOUT_MS = 30_000
+
 async function getHandler() {
   try {
     const jobs = await db.standardsIngestionJob.findMany({
@@ -32,101 +34,107 @@ async function postHandler(req: AuthenticatedRequest) {
     const payload = parsed.data
     const checksum = payload.packageChecksum || computePayloadChecksum(payload)
 
-    const framework = await db.standardFramework.upsert({
-      where: { code: payload.frameworkCode },
-      update: { updatedAt: new Date() },
-      create: {
-        code: payload.frameworkCode,
-        name: payload.frameworkCode,
-        description: `${payload.frameworkCode} standards registry`
-      }
-    })
+    // Replace the version's registry contents atomically and in one
+    // connection, so a failed ingestion never leaves a half-loaded version
+    const { framework, version, job } = await db.$transaction(async (tx) => {
+      const framework = await tx.standardFramework.upsert({
+        where: { code: payload.frameworkCode },
+        update: { updatedAt: new Date() },
+        create: {
+          code: payload.frameworkCode,
+          name: payload.frameworkCode,
+          description: `${payload.frameworkCode} standards registry`
+        }
+      })
 
-    const version = await db.standardVersion.upsert({
-      where: {
-        frameworkId_versionTag: {
+      const version = await tx.standardVersion.upsert({
+        where: {
+          frameworkId_versionTag: {
+            frameworkId: framework.id,
+            versionTag: payload.versionTag
+          }
+        },
+        update: {
+          sourceUrl: payload.sourceUrl,
+          effectiveFrom: payload.effectiveFrom ? new Date(payload.effectiveFrom) : null,
+          packageChecksum: checksum,
+          notes: payload.notes || null,
+          status: 'DRAFT'
+        },
+        create: {
           frameworkId: framework.id,
-          versionTag: payload.versionTag
+          versionTag: payload.versionTag,
+          sourceUrl: payload.sourceUrl,
+          effectiveFrom: payload.effectiveFrom ? new Date(payload.effectiveFrom) : null,
+          packageChecksum: checksum,
+          notes: payload.notes || null,
+          status: 'DRAFT'
         }
-      },
-      update: {
-        sourceUrl: payload.sourceUrl,
-        effectiveFrom: payload.effectiveFrom ? new Date(payload.effectiveFrom) : null,
-        packageChecksum: checksum,
-        notes: payload.notes || null,
-        status: 'DRAFT'
-      },
-      create: {
-        frameworkId: framework.id,
-        versionTag: payload.versionTag,
-        sourceUrl: payload.sourceUrl,
-        effectiveFrom: payload.effectiveFrom ? new Date(payload.effectiveFrom) : null,
-        packageChecksum: checksum,
-        notes: payload.notes || null,
-        status: 'DRAFT'
-      }
-    })
+      })
 
-    await db.standardDisclosure.deleteMany({ where: { versionId: version.id } })
-    await db.standardDatapoint.deleteMany({ where: { versionId: version.id } })
-    await db.standardValidationRule.deleteMany({ where: { versionId: version.id } })
+      await tx.standardDisclosure.deleteMany({ where: { versionId: version.id } })
+      await tx.standardDatapoint.deleteMany({ where: { versionId: version.id } })
+      await tx.standardValidationRule.deleteMany({ where: { versionId: version.id } })
 
-    if (payload.disclosures.length > 0) {
-      await db.standardDisclosure.createMany({
-        data: payload.disclosures.map((d) => ({
-          versionId: version.id,
-          disclosureId: d.disclosureId,
-          title: d.title,
-          level: d.level,
-          mandatoryFor: d.mandatoryFor,
-          sectorSpecific: d.sectorSpecific,
-          parentDisclosureId: d.parentDisclosureId || null
-        }))
-      })
-    }
+      if (payload.disclosures.length > 0) {
+        await tx.standardDisclosure.createMany({
+          data: payload.disclosures.map((d) => ({
+            versionId: version.id,
+            disclosureId: d.disclosureId,
+            title: d.title,
+            level: d.level,
+            mandatoryFor: d.mandatoryFor,
+            sectorSpecific: d.sectorSpecific,
+            parentDisclosureId: d.parentDisclosureId || null
+          }))
+        })
+      }
 
-    if (payload.datapoints.length > 0) {
-      await db.standardDatapoint.createMany({
-        data: payload.datapoints.map((dp) => ({
-          versionId: version.id,
-          code: dp.code,
-          label: dp.label,
-          dataType: dp.dataType,
-          unit: dp.unit || null,
-          allowedValues: dp.allowedValues || [],
-          disclosureId: dp.disclosureId || null,
-          dimensionType: dp.dimensionType
-        }))
-      })
-    }
+      if (payload.datapoints.length > 0) {
+        await tx.standardDatapoint.createMany({
+          data: payload.datapoints.map((dp) => ({
+            versionId: version.id,
+            code: dp.code,
+            label: dp.label,
+            dataType: dp.dataType,
+            unit: dp.unit || null,
+            allowedValues: dp.allowedValues || [],
+            disclosureId: dp.disclosureId || null,
+            dimensionType: dp.dimensionType
+          }))
+        })
+      }
+
+      if (payload.validationRules.length > 0) {
+        await tx.standardValidationRule.createMany({
+          data: payload.validationRules.map((rule) => ({
+            versionId: version.id,
+            ruleCode: rule.ruleCode,
+            severity: rule.severity,
+            assertionType: rule.assertionType,
+            expression: rule.expression,
+            disclosureId: rule.disclosureId || null
+          }))
+        })
+      }
 
-    if (payload.validationRules.length > 0) {
-      await db.standardValidationRule.createMany({
-        data: payload.validationRules.map((rule) => ({
+      const job = await tx.standardsIngestionJob.create({
+        data: {
+          frameworkId: framework.id,
           versionId: version.id,
-          ruleCode: rule.ruleCode,
-          severity: rule.severity,
-          assertionType: rule.assertionType,
-          expression: rule.expression,
-          disclosureId: rule.disclosureId || null
-        }))
+          createdBy: req.user!.userId,
+          status: 'SUCCEEDED',
+          payloadChecksum: checksum,
+          summaryJson: {
+            disclosures: payload.disclosures.length,
+            datapoints: payload.datapoints.length,
+            validationRules: payload.validationRules.length
+          }
+        }
       })
-    }
 
-    const job = await db.standardsIngestionJob.create({
-      data: {
-        frameworkId: framework.id,
-        versionId: version.id,
-        createdBy: req.user!.userId,
-        status: 'SUCCEEDED',
-        payloadChecksum: checksum,
-        summaryJson: {
-          disclosures: payload.disclosures.length,
-          datapoints: payload.datapoints.length,
-          validationRules: payload.validationRules.length
-        }
-      }
-    })
+      return { framework, version, job }
+    }, { timeout: INGESTION_TRANSACTION_TIMEOUT_MS })
 
     return NextResponse.json({
       success: true,
@@ -3,6 +3,15 @@ import { db } from '@/lib/db'
 import { Prisma } from '@prisma/client'
 import { withAdminAuth, AuthenticatedRequest } from '@/lib/middleware'
 
+// The stats fan out into a dozen aggregate queries; keep the serialized
+// response briefly so repeated admin dashboard loads reuse it.
+const STATS_CACHE_TTL_MS = 30_000
+let cachedStats: { body: string; expiresAt: number } | null = null
+
+function sumGroupCounts(groups: Array<{ _count: number }>): number {
+  return groups.reduce((total, group) => total + group._count, 0)
+}
+
 async function handler(req: AuthenticatedRequest) {
   try {
     if (!process.env.DATABASE_URL) {
@@ -26,6 +35,12 @@ async function handler(req: AuthenticatedRequest) {
       })
     }
 
+    if (cachedStats && cachedStats.expiresAt > Date.now()) {
+      return new NextResponse(cachedStats.body, {
+        headers: { 'Content-Type': 'application/json' }
+      })
+    }
+
     const [
       totalUsers,
       activeUsers,
@@ -38,8 +53,9 @@ async function handler(req: AuthenticatedRequest) {
       griAssessments,
       issbAssessments,
       sasbAssessments,
-      dataPoints,
-      complianceChecks
+      esgDataPointsByCategory,
+      complianceChecksByStatus,
+      recentActivity
     ] = await Promise.all([
       db.user.count(),
       db.user.count({
@@ -60,30 +76,26 @@ async function handler(req: AuthenticatedRequest) {
       db.gRIAssessment.count(),
       db.iSSBAssessment.count(),
       db.sASBAssessment.count(),
-      db.eSGDataPoint.count(),
-      db.complianceCheck.count()
-    ])
-
-    // Calculate ESG-specific metrics
-    const esgDataPointsByCategory = await db.eSGDataPoint.groupBy({
-      by: ['category'],
-      _count: true
-    })
-
-    const complianceChecksByStatus = await db.complianceCheck.groupBy({
-      by: ['status'],
-      _count: true
-    })
-
-    const recentActivity = await db.auditLog.findMany({
-      take: 5,
-      orderBy: { timestamp: 'desc' },
-      include: {
-        user: {
-          select: { name: true, email: true }
+      // ESG-specific metrics. category and status are required columns, so
+      // the grouped counts also give the totals without separate count queries.
+      db.eSGDataPoint.groupBy({
+        by: ['category'],
+        _count: true
+      }),
+      db.complianceCheck.groupBy({
+        by: ['status'],
+        _count: true
+      }),
+      db.auditLog.findMany({
+        take: 5,
+        orderBy: { timestamp: 'desc' },
+        include: {
+          user: {
+            select: { name: true, email: true }
+          }
         }
-      }
-    })
+      })
+    ])
 
     const stats = {
       // System metrics
@@ -109,7 +121,7 @@ async function handler(req: AuthenticatedRequest) {
       
       // Data Points
       dataPoints: {
-        total: dataPoints,
+        total: sumGroupCounts(esgDataPointsByCategory),
         byCategory: esgDataPointsByCategory.reduce((acc, item) => {
           acc[item.category] = item._count
           return acc
@@ -118,7 +130,7 @@ async function handler(req: AuthenticatedRequest) {
       
       // Compliance
       complianceChecks: {
-        total: complianceChecks,
+        total: sumGroupCounts(complianceChecksByStatus),
         byStatus: complianceChecksByStatus.reduce((acc, item) => {
           acc[item.status] = item._count
           return acc
@@ -135,7 +147,12 @@ async function handler(req: AuthenticatedRequest) {
       }))
     }
 
-    return NextResponse.json({ stats })
+    const body = JSON.stringify({ stats })
+    cachedStats = { body, expiresAt: Date.now() + STATS_CACHE_TTL_MS }
+
+    return new NextResponse(body, {
+      headers: { 'Content-Type': 'application/json' }
+    })
   } catch (error) {
     console.error('Error fetching system stats:', error)
 
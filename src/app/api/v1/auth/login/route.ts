@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { db } from '@/lib/db'
-import { verifyPassword, generateToken } from '@/lib/auth-utils'
+import { verifyPassword, generateToken, hashPassword, passwordNeedsRehash } from '@/lib/auth-utils'
 import { loginSchema } from '@/lib/validations'
 import { withAuthRateLimit } from '@/lib/security-middleware'
 import { findDemoUserByEmail } from '@/lib/mvp-demo-store'
@@ -97,19 +97,21 @@ const loginHandler = async (request: NextRequest) => {
       role: user.role
     })
 
-    // Update last login time
+    // Update last login time and log the login event in one nested write,
+    // upgrading the stored hash if its cost is stale
     await db.user.update({
       where: { id: user.id },
-      data: { lastLoginAt: new Date() }
-    })
-
-    // Log the login event
-    await db.auditLog.create({
       data: {
-        actor: user.id,
-        action: 'USER_LOGIN',
-        detailJson: { method: 'email_password', success: true }
-      }
+        lastLoginAt: new Date(),
+        ...(passwordNeedsRehash(user.password) && { password: await hashPassword(password) }),
+        auditLogs: {
+          create: {
+            action: 'USER_LOGIN',
+            detailJson: { method: 'email_password', success: true }
+          }
+        }
+      },
+      select: { id: true }
     })
 
     // Return user data and token (excluding password)
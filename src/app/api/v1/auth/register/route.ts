@@ -1,3 +1,4 @@
+import { randomUUID } from 'crypto'
 import { NextRequest, NextResponse } from 'next/server'
 import { db } from '@/lib/db'
 import { hashPassword, generateToken } from '@/lib/auth-utils'
@@ -25,7 +26,7 @@ const registerHandler = async (request: NextRequest) => {
 
       const now = new Date().toISOString()
       const demoUser = {
-        id: `demo-user-${Date.now()}`,
+        id: `demo-user-${randomUUID()}`,
         email,
         name,
         role: 'VIEWER' as const,
@@ -69,28 +70,24 @@ const registerHandler = async (request: NextRequest) => {
       return response
     }
 
-    // Check if user already exists
-    const existingUser = await db.user.findUnique({
-      where: { email }
-    })
-
-    if (existingUser) {
-      return NextResponse.json(
-        { error: 'User with this email already exists' },
-        { status: 409 }
-      )
-    }
-
     // Hash password
     const hashedPassword = await hashPassword(password)
 
-    // Create user - self-registration is always viewer
+    // Create user - self-registration is always viewer. The registration
+    // audit entry is a nested write so both rows share one transaction, and
+    // duplicate emails are caught by the unique index rather than a lookup.
     const user = await db.user.create({
       data: {
         email,
         password: hashedPassword,
         name,
-        role: 'VIEWER'
+        role: 'VIEWER',
+        auditLogs: {
+          create: {
+            action: 'USER_REGISTERED',
+            detailJson: { method: 'self_registration', role: 'VIEWER' }
+          }
+        }
       },
       select: {
         id: true,
@@ -110,15 +107,6 @@ const registerHandler = async (request: NextRequest) => {
       role: user.role
     })
 
-    // Log the registration event
-    await db.auditLog.create({
-      data: {
-        actor: user.id,
-        action: 'USER_REGISTERED',
-        detailJson: { method: 'self_registration', role: user.role }
-      }
-    })
-
     const response = NextResponse.json({
       user,
       token,
@@ -135,6 +123,13 @@ const registerHandler = async (request: NextRequest) => {
 
     return response
   } catch (error) {
+    if ((error as { code?: string })?.code === 'P2002') {
+      return NextResponse.json(
+        { error: 'User with this email already exists' },
+        { status: 409 }
+      )
+    }
+
     console.error('Registration error:', error)
 
     if (error instanceof Error && error.name === 'ZodError') {
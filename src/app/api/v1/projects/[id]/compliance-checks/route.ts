@@ -194,7 +194,8 @@ const GETHandler = async (
 
     // Check if project exists
     const project = await db.project.findUnique({
-      where: { id: projectId }
+      where: { id: projectId },
+      select: { id: true }
     })
 
     if (!project) {
@@ -222,16 +223,6 @@ const GETHandler = async (
     // Get compliance checks
     const complianceChecks = await db.complianceCheck.findMany({
       where: whereClause,
-      include: {
-        assignee: {
-          select: {
-            id: true,
-            name: true,
-            email: true,
-            role: true
-          }
-        }
-      },
       orderBy: [
         { priority: "desc" },
         { dueDate: "asc" },
@@ -239,29 +230,11 @@ const GETHandler = async (
       ]
     })
 
-    const response: ComplianceCheckResponse[] = complianceChecks.map(check => ({
-      id: check.id,
-      projectId: check.projectId,
-      framework: check.framework,
-      requirement: check.requirement,
-      status: check.status,
-      result: check.result,
-      evidence: check.evidence,
-      gapDescription: check.gapDescription,
-      remediation: check.remediation,
-      priority: check.priority,
-      assigneeId: check.assigneeId,
-      dueDate: check.dueDate?.toISOString(),
-      completedAt: check.completedAt?.toISOString(),
-      metadata: check.metadata,
-      createdAt: check.createdAt.toISOString(),
-      updatedAt: check.updatedAt.toISOString()
-    }))
-
+    // Rows already carry the response fields; dates serialize to ISO strings
     return NextResponse.json({
       success: true,
-      data: response,
-      count: response.length
+      data: complianceChecks,
+      count: complianceChecks.length
     })
 
   } catch (error) {
@@ -274,6 +247,7 @@ const GETHandler = async (
 }
 
 async function createSingleComplianceCheck(projectId: string, checkData: any): Promise<ComplianceCheckResponse> {
+  const now = new Date()
   const created = await db.complianceCheck.create({
     data: {
       projectId,
@@ -287,10 +261,10 @@ async function createSingleComplianceCheck(projectId: string, checkData: any): P
       assigneeId: checkData.assigneeId,
       dueDate: checkData.dueDate ? new Date(checkData.dueDate) : null,
       status: checkData.result ? "COMPLETED" : "PENDING",
-      completedAt: checkData.result ? new Date() : null,
+      completedAt: checkData.result ? now : null,
       metadata: {
         ...checkData.metadata,
-        createdAt: new Date().toISOString()
+        createdAt: now.toISOString()
       }
     }
   })
@@ -315,198 +289,203 @@ async function createSingleComplianceCheck(projectId: string, checkData: any): P
   }
 }
 
+// Baseline requirements per framework, shared across requests
+const FRAMEWORK_REQUIREMENTS: Record<string, any[]> = {
+  TCFD: [
+    {
+      requirement: "Board oversight of climate-related risks and opportunities",
+      priority: "HIGH",
+      category: "Governance"
+    },
+    {
+      requirement: "Management's role in assessment and management of climate-related risks",
+      priority: "HIGH",
+      category: "Governance"
+    },
+    {
+      requirement: "Identification and assessment of climate-related risks",
+      priority: "HIGH",
+      category: "Risk Management"
+    },
+    {
+      requirement: "Identification and assessment of climate-related opportunities",
+      priority: "MEDIUM",
+      category: "Strategy"
+    },
+    {
+      requirement: "Processes for managing climate-related risks",
+      priority: "HIGH",
+      category: "Risk Management"
+    },
+    {
+      requirement: "Metrics used to assess climate-related risks",
+      priority: "MEDIUM",
+      category: "Metrics & Targets"
+    },
+    {
+      requirement: "Scope 1 and Scope 2 GHG emissions",
+      priority: "HIGH",
+      category: "Metrics & Targets"
+    },
+    {
+      requirement: "Targets used to manage climate-related risks",
+      priority: "MEDIUM",
+      category: "Metrics & Targets"
+    }
+  ],
+  CSRD: [
+    {
+      requirement: "Double materiality assessment conducted",
+      priority: "CRITICAL",
+      category: "General"
+    },
+    {
+      requirement: "ESRS 1 General requirements disclosure",
+      priority: "HIGH",
+      category: "General"
+    },
+    {
+      requirement: "ESRS 2 Climate change disclosures",
+      priority: "HIGH",
+      category: "Environmental"
+    },
+    {
+      requirement: "ESRS 2 Pollution disclosures",
+      priority: "MEDIUM",
+      category: "Environmental"
+    },
+    {
+      requirement: "ESRS 2 Water and marine resources disclosures",
+      priority: "MEDIUM",
+      category: "Environmental"
+    },
+    {
+      requirement: "ESRS 2 Biodiversity and ecosystems disclosures",
+      priority: "MEDIUM",
+      category: "Environmental"
+    },
+    {
+      requirement: "ESRS 2 Circular economy disclosures",
+      priority: "MEDIUM",
+      category: "Environmental"
+    },
+    {
+      requirement: "ESRS 3 Own workforce disclosures",
+      priority: "HIGH",
+      category: "Social"
+    },
+    {
+      requirement: "ESRS 3 Workers in value chain disclosures",
+      priority: "MEDIUM",
+      category: "Social"
+    },
+    {
+      requirement: "ESRS 3 Affected communities disclosures",
+      priority: "MEDIUM",
+      category: "Social"
+    },
+    {
+      requirement: "ESRS 3 Consumers disclosures",
+      priority: "MEDIUM",
+      category: "Social"
+    },
+    {
+      requirement: "ESRS 5 Business conduct disclosures",
+      priority: "MEDIUM",
+      category: "Governance"
+    },
+    {
+      requirement: "Due diligence processes implemented",
+      priority: "HIGH",
+      category: "Due Diligence"
+    },
+    {
+      requirement: "Sector-specific requirements addressed",
+      priority: "HIGH",
+      category: "Sector-Specific"
+    }
+  ],
+  SASB: [
+    {
+      requirement: "Material topics identified for industry",
+      priority: "HIGH",
+      category: "Materiality"
+    },
+    {
+      requirement: "Industry-specific metrics calculated",
+      priority: "HIGH",
+      category: "Metrics"
+    },
+    {
+      requirement: "Financial impact of sustainability issues disclosed",
+      priority: "MEDIUM",
+      category: "Disclosure"
+    },
+    {
+      requirement: "SASB standards mapping completed",
+      priority: "MEDIUM",
+      category: "Mapping"
+    },
+    {
+      requirement: "Industry benchmark data included",
+      priority: "LOW",
+      category: "Benchmarking"
+    }
+  ],
+  GRI: [
+    {
+      requirement: "Material topics identification process",
+      priority: "HIGH",
+      category: "Materiality"
+    },
+    {
+      requirement: "Stakeholder engagement process",
+      priority: "MEDIUM",
+      category: "Stakeholders"
+    },
+    {
+      requirement: "GRI 101 Foundation disclosures",
+      priority: "HIGH",
+      category: "General"
+    },
+    {
+      requirement: "GRI 102 General disclosures",
+      priority: "HIGH",
+      category: "General"
+    },
+    {
+      requirement: "GRI 103 Management approach",
+      priority: "MEDIUM",
+      category: "Management"
+    },
+    {
+      requirement: "GRI 200 Environmental disclosures",
+      priority: "HIGH",
+      category: "Environmental"
+    },
+    {
+      requirement: "GRI 300 Social disclosures",
+      priority: "HIGH",
+      category: "Social"
+    },
+    {
+      requirement: "GRI 400 Economic disclosures",
+      priority: "MEDIUM",
+      category: "Economic"
+    }
+  ]
+}
+
 async function generateComplianceChecksFromFramework(project: any, framework: string): Promise<any[]> {
   const complianceChecks: any[] = []
-  const dueDate = new Date()
-  dueDate.setDate(dueDate.getDate() + 60) // 60 days from now
-
-  const frameworkRequirements: Record<string, any[]> = {
-    TCFD: [
-      {
-        requirement: "Board oversight of climate-related risks and opportunities",
-        priority: "HIGH",
-        category: "Governance"
-      },
-      {
-        requirement: "Management's role in assessment and management of climate-related risks",
-        priority: "HIGH",
-        category: "Governance"
-      },
-      {
-        requirement: "Identification and assessment of climate-related risks",
-        priority: "HIGH",
-        category: "Risk Management"
-      },
-      {
-        requirement: "Identification and assessment of climate-related opportunities",
-        priority: "MEDIUM",
-        category: "Strategy"
-      },
-      {
-        requirement: "Processes for managing climate-related risks",
-        priority: "HIGH",
-        category: "Risk Management"
-      },
-      {
-        requirement: "Metrics used to assess climate-related risks",
-        priority: "MEDIUM",
-        category: "Metrics & Targets"
-      },
-      {
-        requirement: "Scope 1 and Scope 2 GHG emissions",
-        priority: "HIGH",
-        category: "Metrics & Targets"
-      },
-      {
-        requirement: "Targets used to manage climate-related risks",
-        priority: "MEDIUM",
-        category: "Metrics & Targets"
-      }
-    ],
-    CSRD: [
-      {
-        requirement: "Double materiality assessment conducted",
-        priority: "CRITICAL",
-        category: "General"
-      },
-      {
-        requirement: "ESRS 1 General requirements disclosure",
-        priority: "HIGH",
-        category: "General"
-      },
-      {
-        requirement: "ESRS 2 Climate change disclosures",
-        priority: "HIGH",
-        category: "Environmental"
-      },
-      {
-        requirement: "ESRS 2 Pollution disclosures",
-        priority: "MEDIUM",
-        category: "Environmental"
-      },
-      {
-        requirement: "ESRS 2 Water and marine resources disclosures",
-        priority: "MEDIUM",
-        category: "Environmental"
-      },
-      {
-        requirement: "ESRS 2 Biodiversity and ecosystems disclosures",
-        priority: "MEDIUM",
-        category: "Environmental"
-      },
-      {
-        requirement: "ESRS 2 Circular economy disclosures",
-        priority: "MEDIUM",
-        category: "Environmental"
-      },
-      {
-        requirement: "ESRS 3 Own workforce disclosures",
-        priority: "HIGH",
-        category: "Social"
-      },
-      {
-        requirement: "ESRS 3 Workers in value chain disclosures",
-        priority: "MEDIUM",
-        category: "Social"
-      },
-      {
-        requirement: "ESRS 3 Affected communities disclosures",
-        priority: "MEDIUM",
-        category: "Social"
-      },
-      {
-        requirement: "ESRS 3 Consumers disclosures",
-        priority: "MEDIUM",
-        category: "Social"
-      },
-      {
-        requirement: "ESRS 5 Business conduct disclosures",
-        priority: "MEDIUM",
-        category: "Governance"
-      },
-      {
-        requirement: "Due diligence processes implemented",
-        priority: "HIGH",
-        category: "Due Diligence"
-      },
-      {
-        requirement: "Sector-specific requirements addressed",
-        priority: "HIGH",
-        category: "Sector-Specific"
-      }
-    ],
-    SASB: [
-      {
-        requirement: "Material topics identified for industry",
-        priority: "HIGH",
-        category: "Materiality"
-      },
-      {
-        requirement: "Industry-specific metrics calculated",
-        priority: "HIGH",
-        category: "Metrics"
-      },
-      {
-        requirement: "Financial impact of sustainability issues disclosed",
-        priority: "MEDIUM",
-        category: "Disclosure"
-      },
-      {
-        requirement: "SASB standards mapping completed",
-        priority: "MEDIUM",
-        category: "Mapping"
-      },
-      {
-        requirement: "Industry benchmark data included",
-        priority: "LOW",
-        category: "Benchmarking"
-      }
-    ],
-    GRI: [
-      {
-        requirement: "Material topics identification process",
-        priority: "HIGH",
-        category: "Materiality"
-      },
-      {
-        requirement: "Stakeholder engagement process",
-        priority: "MEDIUM",
-        category: "Stakeholders"
-      },
-      {
-        requirement: "GRI 101 Foundation disclosures",
-        priority: "HIGH",
-        category: "General"
-      },
-      {
-        requirement: "GRI 102 General disclosures",
-        priority: "HIGH",
-        category: "General"
-      },
-      {
-        requirement: "GRI 103 Management approach",
-        priority: "MEDIUM",
-        category: "Management"
-      },
-      {
-        requirement: "GRI 200 Environmental disclosures",
-        priority: "HIGH",
-        category: "Environmental"
-      },
-      {
-        requirement: "GRI 300 Social disclosures",
-        priority: "HIGH",
-        category: "Social"
-      },
-      {
-        requirement: "GRI 400 Economic disclosures",
-        priority: "MEDIUM",
-        category: "Economic"
-      }
-    ]
-  }
-
-  const requirements = frameworkRequirements[framework]
+  // Timestamps are shared by every generated check, so format them once
+  const now = new Date()
+  const generatedAt = now.toISOString()
+  const dueDateValue = new Date(now)
+  dueDateValue.setDate(dueDateValue.getDate() + 60) // 60 days from now
+  const dueDate = dueDateValue.toISOString()
+
+  const requirements = FRAMEWORK_REQUIREMENTS[framework]
   
   if (!requirements) {
     throw new Error(`Unsupported framework: ${framework}`)
@@ -518,12 +497,12 @@ async function generateComplianceChecksFromFramework(project: any, framework: st
       framework,
       requirement: req.requirement,
       priority: req.priority,
-      dueDate: dueDate.toISOString(),
+      dueDate,
       metadata: {
         category: req.category,
         generated: true,
         framework,
-        generatedAt: new Date().toISOString()
+        generatedAt
       }
     })
   }
@@ -536,12 +515,12 @@ async function generateComplianceChecksFromFramework(project: any, framework: st
       framework,
       requirement: "Energy-specific climate risk assessment completed",
       priority: "HIGH",
-      dueDate: dueDate.toISOString(),
+      dueDate,
       metadata: {
         category: "Industry-Specific",
         generated: true,
         sectorSpecific: true,
-        generatedAt: new Date().toISOString()
+        generatedAt
       }
     })
   }
@@ -551,12 +530,12 @@ async function generateComplianceChecksFromFramework(project: any, framework: st
       framework,
       requirement: "Financial sector climate risk disclosures",
       priority: "HIGH",
-      dueDate: dueDate.toISOString(),
+      dueDate,
       metadata: {
         category: "Industry-Specific",
         generated: true,
         sectorSpecific: true,
-        generatedAt: new Date().toISOString()
+        generatedAt
       }
     })
   }
@@ -566,12 +545,12 @@ async function generateComplianceChecksFromFramework(project: any, framework: st
       framework,
       requirement: "Manufacturing supply chain climate disclosures",
       priority: "MEDIUM",
-      dueDate: dueDate.toISOString(),
+      dueDate,
       metadata: {
         category: "Industry-Specific",
         generated: true,
         sectorSpecific: true,
-        generatedAt: new Date().toISOString()
+        generatedAt
       }
     })
   }
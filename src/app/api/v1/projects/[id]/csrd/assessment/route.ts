@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
 import { withAuth, AuthenticatedRequest } from "@/lib/middleware"
-import ZAI from "z-ai-web-dev-sdk"
+import { getZAI } from "@/lib/ai-client"
 import { z } from "zod"
 
 const csrdAssessmentSchema = z.object({
@@ -108,8 +108,7 @@ const POSTHandler = async (
     const project = await db.project.findUnique({
       where: { id: projectId },
       include: {
-        organisation: true,
-        scopeStructuredJson: true
+        organisation: true
       }
     })
 
@@ -273,7 +272,7 @@ const GETHandler = async (
 }
 
 async function generateCSRDFromScope(project: any): Promise<any> {
-  const zai = await ZAI.create()
+  const zai = await getZAI()
 
   const systemPrompt = `You are a CSRD (Corporate Sustainability Reporting Directive) expert. Your task is to analyze company scope information and generate a comprehensive CSRD assessment covering all key requirements:
 
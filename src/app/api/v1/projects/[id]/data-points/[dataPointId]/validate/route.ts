@@ -47,10 +47,16 @@ const POSTHandler = async (
     const dataPointId = params.dataPointId
     const body = await request.json() as ValidationRequest
 
-    // Check if project exists
-    const project = await db.project.findUnique({
-      where: { id: projectId }
-    })
+    // Look up the project and data point together
+    const [project, dataPoint] = await Promise.all([
+      db.project.findUnique({
+        where: { id: projectId },
+        select: { id: true }
+      }),
+      db.eSGDataPoint.findUnique({
+        where: { id: dataPointId, projectId }
+      })
+    ])
 
     if (!project) {
       return NextResponse.json(
@@ -59,11 +65,6 @@ const POSTHandler = async (
       )
     }
 
-    // Check if data point exists
-    const dataPoint = await db.eSGDataPoint.findUnique({
-      where: { id: dataPointId, projectId }
-    })
-
     if (!dataPoint) {
       return NextResponse.json(
         { error: "Data point not found" },
@@ -399,15 +400,24 @@ async function checkConsistency(dataPoint: any): Promise<any[]> {
   const issues: any[] = []
 
   try {
-    // Get related data points for consistency checking
-    const relatedDataPoints = await db.eSGDataPoint.findMany({
-      where: {
-        projectId: dataPoint.projectId,
-        year: dataPoint.year,
-        category: dataPoint.category,
-        id: { not: dataPoint.id }
-      }
-    })
+    // Get related and previous-year data points for consistency checking
+    const [relatedDataPoints, previousYearData] = await Promise.all([
+      db.eSGDataPoint.findMany({
+        where: {
+          projectId: dataPoint.projectId,
+          year: dataPoint.year,
+          category: dataPoint.category,
+          id: { not: dataPoint.id }
+        }
+      }),
+      db.eSGDataPoint.findMany({
+        where: {
+          projectId: dataPoint.projectId,
+          metricCode: dataPoint.metricCode,
+          year: dataPoint.year - 1
+        }
+      })
+    ])
 
     // Check for logical consistency between related metrics
     if (dataPoint.metricCode.includes("emission") && dataPoint.value !== null) {
@@ -427,14 +437,6 @@ async function checkConsistency(dataPoint: any): Promise<any[]> {
     }
 
     // Check for year-over-year consistency
-    const previousYearData = await db.eSGDataPoint.findMany({
-      where: {
-        projectId: dataPoint.projectId,
-        metricCode: dataPoint.metricCode,
-        year: dataPoint.year - 1
-      }
-    })
-
     if (previousYearData.length > 0 && dataPoint.value !== null) {
       const previousValue = previousYearData[0].value
       if (previousValue !== null) {
@@ -18,6 +18,8 @@ const dataPointSchema = z.object({
   metadata: z.object({}).optional()
 })
 
+const MAX_DATA_POINTS_PAGE_SIZE = 1000
+
 const bulkDataPointsSchema = z.object({
   dataPoints: z.array(dataPointSchema)
 })
@@ -57,9 +59,12 @@ const POSTHandler = async (
     const projectId = params.id
     const body = await request.json() as DataPointRequest
 
-    // Check if project exists
+    // Check if project exists; generated metrics depend on the organisation's sector
     const project = await db.project.findUnique({
-      where: { id: projectId }
+      where: { id: projectId },
+      include: {
+        organisation: { select: { sector: true } }
+      }
     })
 
     if (!project) {
@@ -74,11 +79,7 @@ const POSTHandler = async (
     // Handle bulk data points creation
     if (body.bulkDataPoints) {
       const validatedData = bulkDataPointsSchema.parse(body.bulkDataPoints)
-      
-      for (const dataPoint of validatedData.dataPoints) {
-        const created = await createSingleDataPoint(projectId, dataPoint)
-        createdDataPoints.push(created)
-      }
+      createdDataPoints = await createDataPoints(projectId, validatedData.dataPoints)
 
       // Log the bulk action
       await db.auditLog.create({
@@ -132,11 +133,7 @@ const POSTHandler = async (
     // Generate data points from standards if requested
     if (body.generateFromStandards) {
       const generatedDataPoints = await generateDataPointsFromStandards(project, body.standards || [])
-      
-      for (const dataPoint of generatedDataPoints) {
-        const created = await createSingleDataPoint(projectId, dataPoint)
-        createdDataPoints.push(created)
-      }
+      createdDataPoints = await createDataPoints(projectId, generatedDataPoints)
 
       // Log the action
       await db.auditLog.create({
@@ -191,10 +188,15 @@ const GETHandler = async (
     const category = searchParams.get("category")
     const year = searchParams.get("year")
     const validationStatus = searchParams.get("validationStatus")
+    const cursor = searchParams.get("cursor")
+    const limitParam = parseInt(searchParams.get("limit") || "", 10)
+    // Optional paging keeps large projects from being loaded in one response
+    const limit = Number.isNaN(limitParam) ? undefined : Math.min(Math.max(limitParam, 1), MAX_DATA_POINTS_PAGE_SIZE)
 
     // Check if project exists
     const project = await db.project.findUnique({
-      where: { id: projectId }
+      where: { id: projectId },
+      select: { id: true }
     })
 
     if (!project) {
@@ -226,33 +228,22 @@ const GETHandler = async (
         { category: "asc" },
         { subcategory: "asc" },
         { metricName: "asc" },
-        { year: "desc" }
-      ]
+        { year: "desc" },
+        { id: "asc" }
+      ],
+      ...(limit && { take: limit + 1 }),
+      ...(limit && cursor && { cursor: { id: cursor }, skip: 1 })
     })
 
-    const response: DataPointResponse[] = dataPoints.map(dp => ({
-      id: dp.id,
-      projectId: dp.projectId,
-      category: dp.category,
-      subcategory: dp.subcategory,
-      metricName: dp.metricName,
-      metricCode: dp.metricCode,
-      value: dp.value,
-      unit: dp.unit,
-      year: dp.year,
-      period: dp.period,
-      dataSource: dp.dataSource,
-      confidence: dp.confidence,
-      validationStatus: dp.validationStatus,
-      metadata: dp.metadata,
-      createdAt: dp.createdAt.toISOString(),
-      updatedAt: dp.updatedAt.toISOString()
-    }))
+    const hasMore = limit !== undefined && dataPoints.length > limit
+    const page = hasMore ? dataPoints.slice(0, limit) : dataPoints
 
+    // Rows already match DataPointResponse; dates serialize to ISO strings
     return NextResponse.json({
       success: true,
-      data: response,
-      count: response.length
+      data: page,
+      count: page.length,
+      ...(limit && { nextCursor: hasMore ? page[page.length - 1].id : null })
     })
 
   } catch (error) {
@@ -264,25 +255,25 @@ const GETHandler = async (
   }
 }
 
-async function createSingleDataPoint(projectId: string, dataPoint: any): Promise<DataPointResponse> {
-  const created = await db.eSGDataPoint.create({
-    data: {
-      projectId,
-      category: dataPoint.category,
-      subcategory: dataPoint.subcategory,
-      metricName: dataPoint.metricName,
-      metricCode: dataPoint.metricCode,
-      value: dataPoint.value,
-      unit: dataPoint.unit,
-      year: dataPoint.year,
-      period: dataPoint.period,
-      dataSource: dataPoint.dataSource,
-      confidence: dataPoint.confidence,
-      validationStatus: dataPoint.validationStatus,
-      metadata: dataPoint.metadata
-    }
-  })
+function toDataPointData(projectId: string, dataPoint: any) {
+  return {
+    projectId,
+    category: dataPoint.category,
+    subcategory: dataPoint.subcategory,
+    metricName: dataPoint.metricName,
+    metricCode: dataPoint.metricCode,
+    value: dataPoint.value,
+    unit: dataPoint.unit,
+    year: dataPoint.year,
+    period: dataPoint.period,
+    dataSource: dataPoint.dataSource,
+    confidence: dataPoint.confidence,
+    validationStatus: dataPoint.validationStatus,
+    metadata: dataPoint.metadata
+  }
+}
 
+function toDataPointResponse(created: any): DataPointResponse {
   return {
     id: created.id,
     projectId: created.projectId,
@@ -303,105 +294,128 @@ async function createSingleDataPoint(projectId: string, dataPoint: any): Promise
   }
 }
 
+async function createSingleDataPoint(projectId: string, dataPoint: any): Promise<DataPointResponse> {
+  const created = await db.eSGDataPoint.create({
+    data: toDataPointData(projectId, dataPoint)
+  })
+
+  return toDataPointResponse(created)
+}
+
+// Bulk and generated data points are inserted with one multi-row statement
+// rather than one round trip per row
+async function createDataPoints(projectId: string, dataPoints: any[]): Promise<DataPointResponse[]> {
+  if (dataPoints.length === 0) return []
+
+  const created = await db.eSGDataPoint.createManyAndReturn({
+    data: dataPoints.map(dataPoint => toDataPointData(projectId, dataPoint))
+  })
+
+  return created.map(toDataPointResponse)
+}
+
+// Standard ESG metrics mapping, shared across requests
+const STANDARD_METRICS: Record<string, any[]> = {
+  GRI: [
+    {
+      category: "Environmental",
+      subcategory: "Energy",
+      metricName: "Energy consumption within the organization",
+      metricCode: "GRI_302_1",
+      unit: "GJ",
+      period: "Annual"
+    },
+    {
+      category: "Environmental",
+      subcategory: "Emissions",
+      metricName: "Direct (Scope 1) GHG emissions",
+      metricCode: "GRI_305_1",
+      unit: "tCO2e",
+      period: "Annual"
+    },
+    {
+      category: "Social",
+      subcategory: "Labor Practices",
+      metricName: "New employee hires during the reporting period",
+      metricCode: "GRI_401_1",
+      unit: "count",
+      period: "Annual"
+    },
+    {
+      category: "Governance",
+      subcategory: "Ethics",
+      metricName: "Board independence",
+      metricCode: "GRI_102_18",
+      unit: "percentage",
+      period: "Annual"
+    }
+  ],
+  SASB: [
+    {
+      category: "Environmental",
+      subcategory: "Climate Change",
+      metricName: "GHG emissions intensity",
+      metricCode: "SASB_EM_MM_130A_1",
+      unit: "tCO2e/revenue",
+      period: "Annual"
+    },
+    {
+      category: "Social",
+      subcategory: "Human Capital",
+      metricName: "Employee turnover",
+      metricCode: "SASB_HC_RT_440A_1",
+      unit: "percentage",
+      period: "Annual"
+    }
+  ],
+  TCFD: [
+    {
+      category: "Environmental",
+      subcategory: "Climate Change",
+      metricName: "Scope 1 emissions",
+      metricCode: "TCFD_MET_001",
+      unit: "tCO2e",
+      period: "Annual"
+    },
+    {
+      category: "Governance",
+      subcategory: "Climate Governance",
+      metricName: "Board oversight of climate-related risks",
+      metricCode: "TCFD_GOV_001",
+      unit: "binary",
+      period: "Annual"
+    }
+  ],
+  CSRD: [
+    {
+      category: "Environmental",
+      subcategory: "Climate Change",
+      metricName: "GHG emissions (Scope 1+2)",
+      metricCode: "ESRS_E1_2",
+      unit: "tCO2e",
+      period: "Annual"
+    },
+    {
+      category: "Social",
+      subcategory: "Workforce",
+      metricName: "Gender diversity in senior management",
+      metricCode: "ESRS_S1_5",
+      unit: "percentage",
+      period: "Annual"
+    }
+  ]
+}
+
 async function generateDataPointsFromStandards(project: any, standards: string[]): Promise<any[]> {
   const dataPoints: any[] = []
-  const currentYear = new Date().getFullYear()
-
-  // Standard ESG metrics mapping
-  const standardMetrics: Record<string, any[]> = {
-    GRI: [
-      {
-        category: "Environmental",
-        subcategory: "Energy",
-        metricName: "Energy consumption within the organization",
-        metricCode: "GRI_302_1",
-        unit: "GJ",
-        period: "Annual"
-      },
-      {
-        category: "Environmental",
-        subcategory: "Emissions",
-        metricName: "Direct (Scope 1) GHG emissions",
-        metricCode: "GRI_305_1",
-        unit: "tCO2e",
-        period: "Annual"
-      },
-      {
-        category: "Social",
-        subcategory: "Labor Practices",
-        metricName: "New employee hires during the reporting period",
-        metricCode: "GRI_401_1",
-        unit: "count",
-        period: "Annual"
-      },
-      {
-        category: "Governance",
-        subcategory: "Ethics",
-        metricName: "Board independence",
-        metricCode: "GRI_102_18",
-        unit: "percentage",
-        period: "Annual"
-      }
-    ],
-    SASB: [
-      {
-        category: "Environmental",
-        subcategory: "Climate Change",
-        metricName: "GHG emissions intensity",
-        metricCode: "SASB_EM_MM_130A_1",
-        unit: "tCO2e/revenue",
-        period: "Annual"
-      },
-      {
-        category: "Social",
-        subcategory: "Human Capital",
-        metricName: "Employee turnover",
-        metricCode: "SASB_HC_RT_440A_1",
-        unit: "percentage",
-        period: "Annual"
-      }
-    ],
-    TCFD: [
-      {
-        category: "Environmental",
-        subcategory: "Climate Change",
-        metricName: "Scope 1 emissions",
-        metricCode: "TCFD_MET_001",
-        unit: "tCO2e",
-        period: "Annual"
-      },
-      {
-        category: "Governance",
-        subcategory: "Climate Governance",
-        metricName: "Board oversight of climate-related risks",
-        metricCode: "TCFD_GOV_001",
-        unit: "binary",
-        period: "Annual"
-      }
-    ],
-    CSRD: [
-      {
-        category: "Environmental",
-        subcategory: "Climate Change",
-        metricName: "GHG emissions (Scope 1+2)",
-        metricCode: "ESRS_E1_2",
-        unit: "tCO2e",
-        period: "Annual"
-      },
-      {
-        category: "Social",
-        subcategory: "Workforce",
-        metricName: "Gender diversity in senior management",
-        metricCode: "ESRS_S1_5",
-        unit: "percentage",
-        period: "Annual"
-      }
-    ]
-  }
+  // One timestamp for the whole batch instead of a Date per generated metric
+  const now = new Date()
+  const currentYear = now.getFullYear()
+  const generatedAt = now.toISOString()
 
   // Generate data points for each requested standard
   for (const standard of standards) {
-    const metrics = standardMetrics[standard]
+    const metrics = STANDARD_METRICS[standard]
     if (metrics) {
       for (const metric of metrics) {
         dataPoints.push({
@@ -413,7 +427,7 @@ async function generateDataPointsFromStandards(project: any, standards: string[]
           metadata: {
             generated: true,
             standard: standard,
-            generatedAt: new Date().toISOString()
+            generatedAt
           }
         })
       }
@@ -422,7 +436,7 @@ async function generateDataPointsFromStandards(project: any, standards: string[]
 
   // If no standards specified, generate basic GRI metrics
   if (standards.length === 0) {
-    const griMetrics = standardMetrics.GRI
+    const griMetrics = STANDARD_METRICS.GRI
     for (const metric of griMetrics) {
       dataPoints.push({
         ...metric,
@@ -433,7 +447,7 @@ async function generateDataPointsFromStandards(project: any, standards: string[]
         metadata: {
           generated: true,
           standard: "GRI",
-          generatedAt: new Date().toISOString()
+          generatedAt
         }
       })
     }
@@ -457,7 +471,7 @@ async function generateDataPointsFromStandards(project: any, standards: string[]
       metadata: {
         generated: true,
         sectorSpecific: true,
-        generatedAt: new Date().toISOString()
+        generatedAt
       }
     })
   }
@@ -477,7 +491,7 @@ async function generateDataPointsFromStandards(project: any, standards: string[]
       metadata: {
         generated: true,
         sectorSpecific: true,
-        generatedAt: new Date().toISOString()
+        generatedAt
       }
     })
   }
@@ -497,7 +511,7 @@ async function generateDataPointsFromStandards(project: any, standards: string[]
       metadata: {
         generated: true,
         sectorSpecific: true,
-        generatedAt: new Date().toISOString()
+        generatedAt
       }
     })
   }
@@ -476,37 +476,40 @@ export async function POST(
       generatedContentIndex: buildGRIContentIndex(disclosures, omissions)
     };
 
-    // Save assessment to database
-    const griAssessment = await db.gRIAssessment.create({
-      data: {
-        projectId: projectId,
-        universalStandards: assessment.universalStandards,
-        sectorStandards: {
-          ...(assessment.sectorStandards as Record<string, unknown>),
-          sectorStandardsApplied
-        },
-        topicStandards: assessment.topicStandards,
-        reportingPrinciples: {
-          ...(assessment.reportingPrinciples as Record<string, unknown>),
-          reportingPath,
-          statementOfUse,
-          contentIndexUrl,
-          taxonomyMapping
-        },
-        stakeholderEngagement: assessment.stakeholderEngagement,
-        materiality: {
-          ...(assessment.materiality as Record<string, unknown>),
-          excludedLikelyMaterialTopics
-        },
-        disclosures: {
-          ...(assessment.disclosures as Record<string, unknown>),
-          submittedDisclosures: disclosures,
-          omissions
-        },
-        overallScore: assessment.overallScore,
-        gapAnalysis: assessment.gapAnalysis,
-        recommendations: assessment.recommendations
-      }
+    // Save assessment to database, replacing the project's previous one in place
+    const griAssessmentData = {
+      universalStandards: assessment.universalStandards,
+      sectorStandards: {
+        ...(assessment.sectorStandards as Record<string, unknown>),
+        sectorStandardsApplied
+      },
+      topicStandards: assessment.topicStandards,
+      reportingPrinciples: {
+        ...(assessment.reportingPrinciples as Record<string, unknown>),
+        reportingPath,
+        statementOfUse,
+        contentIndexUrl,
+        taxonomyMapping
+      },
+      stakeholderEngagement: assessment.stakeholderEngagement,
+      materiality: {
+        ...(assessment.materiality as Record<string, unknown>),
+        excludedLikelyMaterialTopics
+      },
+      disclosures: {
+        ...(assessment.disclosures as Record<string, unknown>),
+        submittedDisclosures: disclosures,
+        omissions
+      },
+      overallScore: assessment.overallScore,
+      gapAnalysis: assessment.gapAnalysis,
+      recommendations: assessment.recommendations
+    };
+
+    const griAssessment = await db.gRIAssessment.upsert({
+      where: { projectId },
+      update: griAssessmentData,
+      create: { projectId, ...griAssessmentData }
     });
 
     return NextResponse.json({
@@ -539,10 +542,9 @@ export async function GET(
 
     const projectId = params.id;
 
-    // Get latest GRI assessment for the project
-    const assessment = await db.gRIAssessment.findFirst({
-      where: { projectId },
-      orderBy: { createdAt: 'desc' }
+    // Get the GRI assessment for the project
+    const assessment = await db.gRIAssessment.findUnique({
+      where: { projectId }
     });
 
     if (!assessment) {
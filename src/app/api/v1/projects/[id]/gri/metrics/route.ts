@@ -3,6 +3,9 @@ import { db } from '@/lib/db';
 import { getServerSession } from 'next-auth';
 import { authOptions } from '@/lib/auth';
 
+// Maximum number of batch updates in flight at once
+const BATCH_UPDATE_SIZE = 10;
+
 // GRI Standard metrics definitions
 const GRI_METRICS = {
   // Universal Standards
@@ -238,13 +241,16 @@ export async function POST(
     const standardMatch = metricCode.match(/GRI_(\d{3})/);
     const subcategory = standardMatch ? `GRI ${standardMatch[1]}` : 'Unknown';
 
+    const now = new Date();
+    const reportingYear = year || now.getFullYear();
+
     // Create or update ESG data point
     const dataPoint = await db.eSGDataPoint.upsert({
       where: {
         projectId_metricCode_year: {
           projectId: projectId,
           metricCode: metricCode,
-          year: year || new Date().getFullYear()
+          year: reportingYear
         }
       },
       update: {
@@ -255,7 +261,7 @@ export async function POST(
         confidence: 0.8, // Default confidence
         validationStatus: 'PENDING',
         metadata: notes ? { notes } : null,
-        updatedAt: new Date()
+        updatedAt: now
       },
       create: {
         projectId: projectId,
@@ -265,7 +271,7 @@ export async function POST(
         metricCode: metricCode,
         value: parseFloat(value),
         unit: unit || null,
-        year: year || new Date().getFullYear(),
+        year: reportingYear,
         period: period || 'Annual',
         dataSource: dataSource || 'Manual entry',
         confidence: 0.8,
@@ -319,28 +325,37 @@ export async function PUT(
       return NextResponse.json({ error: 'Project not found' }, { status: 404 });
     }
 
-    const results = [];
-
-    for (const dp of dataPoints) {
-      try {
-        const updated = await db.eSGDataPoint.update({
-          where: { id: dp.id },
-          data: {
-            value: dp.value,
-            unit: dp.unit,
-            validationStatus: dp.validationStatus,
-            confidence: dp.confidence,
-            metadata: dp.metadata,
-            updatedAt: new Date()
-          }
-        });
-        results.push(updated);
-      } catch (error) {
-        console.error(`Failed to update data point ${dp.id}:`, error);
-        results.push({ id: dp.id, error: 'Update failed' });
-      }
+    // Updates are independent, so issue them a slice at a time (bounded so a
+    // large batch cannot exhaust the connection pool) and report each outcome
+    // in request order.
+    const updatedAt = new Date();
+    const settled: PromiseSettledResult<unknown>[] = [];
+    for (let start = 0; start < dataPoints.length; start += BATCH_UPDATE_SIZE) {
+      const slice = dataPoints.slice(start, start + BATCH_UPDATE_SIZE);
+      settled.push(...await Promise.allSettled(
+        slice.map((dp: any) =>
+          db.eSGDataPoint.update({
+            where: { id: dp.id },
+            data: {
+              value: dp.value,
+              unit: dp.unit,
+              validationStatus: dp.validationStatus,
+              confidence: dp.confidence,
+              metadata: dp.metadata,
+              updatedAt
+            }
+          })
+        )
+      ));
     }
 
+    const results = settled.map((outcome, index) => {
+      if (outcome.status === 'fulfilled') return outcome.value;
+      const { id } = dataPoints[index];
+      console.error(`Failed to update data point ${id}:`, outcome.reason);
+      return { id, error: 'Update failed' };
+    });
+
     return NextResponse.json({
       success: true,
       results,
@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
 import { withAuth, AuthenticatedRequest } from "@/lib/middleware"
-import ZAI from "z-ai-web-dev-sdk"
+import { getZAI } from "@/lib/ai-client"
 import { z } from "zod"
 
 const issbAssessmentSchema = z.object({
@@ -194,8 +194,7 @@ const POSTHandler = async (
     const project = await db.project.findUnique({
       where: { id: projectId },
       include: {
-        organisation: true,
-        scopeStructuredJson: true
+        organisation: true
       }
     })
 
@@ -431,7 +430,7 @@ const GETHandler = async (
 }
 
 async function generateISSBFromScope(project: any): Promise<any> {
-  const zai = await ZAI.create()
+  const zai = await getZAI()
 
   const systemPrompt = `You are an ISSB (International Sustainability Standards Board) expert. Your task is to analyze company scope information and generate a comprehensive ISSB assessment covering IFRS S1 and IFRS S2 requirements.
 
@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
 import { withAuth, AuthenticatedRequest } from "@/lib/middleware"
-import ZAI from "z-ai-web-dev-sdk"
+import { getZAI } from "@/lib/ai-client"
 
 interface MaterialityRequest {
   projectId: string
@@ -35,6 +35,9 @@ const POSTHandler = async (
     const projectId = params.id
     const body = await request.json() as MaterialityRequest
 
+    // Start SDK initialisation so it overlaps with the project lookup
+    const zaiClient = getZAI()
+
     // Check if project exists
     const project = await db.project.findUnique({
       where: { id: projectId },
@@ -55,7 +58,7 @@ const POSTHandler = async (
     const rawScope = project.scopeRaw || ""
 
     // Initialize ZAI SDK
-    const zai = await ZAI.create()
+    const zai = await zaiClient
 
     // Create the system prompt for materiality analysis
     const systemPrompt = `You are an ESG materiality assessment expert. Your task is to analyze company scope and identify material ESG topics based on:
@@ -200,72 +203,72 @@ Please analyze and identify the most material ESG topics for this organization,
   }
 }
 
-function createFallbackMaterialityResponse(sector: string): MaterialityResponse {
-  // Industry-specific materiality topics as fallback
-  const sectorTopics: Record<string, MaterialityTopic[]> = {
-    technology: [
-      {
-        topic: "Data Privacy and Security",
-        category: "Governance",
-        financialImpact: 8,
-        stakeholderImpact: 9,
-        overallScore: 8.5,
-        justification: "Critical for tech companies handling user data",
-        evidence: ["Privacy policies", "Security audits", "Data breach reports"]
-      },
-      {
-        topic: "Energy Consumption",
-        category: "Environmental",
-        financialImpact: 6,
-        stakeholderImpact: 7,
-        overallScore: 6.5,
-        justification: "Data centers and operations consume significant energy",
-        evidence: ["Energy usage reports", "Renewable energy procurement", "Carbon footprint"]
-      }
-    ],
-    manufacturing: [
-      {
-        topic: "Occupational Health and Safety",
-        category: "Social",
-        financialImpact: 7,
-        stakeholderImpact: 9,
-        overallScore: 8,
-        justification: "Critical for manufacturing operations",
-        evidence: ["Safety incidents", "Training records", "Compliance audits"]
-      },
-      {
-        topic: "Waste Management",
-        category: "Environmental",
-        financialImpact: 6,
-        stakeholderImpact: 8,
-        overallScore: 7,
-        justification: "Manufacturing processes generate waste streams",
-        evidence: ["Waste audits", "Recycling programs", "Hazardous waste disposal"]
-      }
-    ],
-    default: [
-      {
-        topic: "Climate Change",
-        category: "Environmental",
-        financialImpact: 7,
-        stakeholderImpact: 8,
-        overallScore: 7.5,
-        justification: "Universal material topic for all businesses",
-        evidence: ["Carbon inventory", "Climate risk assessment", "Reduction targets"]
-      },
-      {
-        topic: "Diversity and Inclusion",
-        category: "Social",
-        financialImpact: 6,
-        stakeholderImpact: 8,
-        overallScore: 7,
-        justification: "Important for workforce and reputation",
-        evidence: ["Workforce demographics", "D&I programs", "Pay equity analysis"]
-      }
-    ]
-  }
+// Industry-specific materiality topics as fallback, shared across requests
+const SECTOR_TOPICS: Record<string, MaterialityTopic[]> = {
+  technology: [
+    {
+      topic: "Data Privacy and Security",
+      category: "Governance",
+      financialImpact: 8,
+      stakeholderImpact: 9,
+      overallScore: 8.5,
+      justification: "Critical for tech companies handling user data",
+      evidence: ["Privacy policies", "Security audits", "Data breach reports"]
+    },
+    {
+      topic: "Energy Consumption",
+      category: "Environmental",
+      financialImpact: 6,
+      stakeholderImpact: 7,
+      overallScore: 6.5,
+      justification: "Data centers and operations consume significant energy",
+      evidence: ["Energy usage reports", "Renewable energy procurement", "Carbon footprint"]
+    }
+  ],
+  manufacturing: [
+    {
+      topic: "Occupational Health and Safety",
+      category: "Social",
+      financialImpact: 7,
+      stakeholderImpact: 9,
+      overallScore: 8,
+      justification: "Critical for manufacturing operations",
+      evidence: ["Safety incidents", "Training records", "Compliance audits"]
+    },
+    {
+      topic: "Waste Management",
+      category: "Environmental",
+      financialImpact: 6,
+      stakeholderImpact: 8,
+      overallScore: 7,
+      justification: "Manufacturing processes generate waste streams",
+      evidence: ["Waste audits", "Recycling programs", "Hazardous waste disposal"]
+    }
+  ],
+  default: [
+    {
+      topic: "Climate Change",
+      category: "Environmental",
+      financialImpact: 7,
+      stakeholderImpact: 8,
+      overallScore: 7.5,
+      justification: "Universal material topic for all businesses",
+      evidence: ["Carbon inventory", "Climate risk assessment", "Reduction targets"]
+    },
+    {
+      topic: "Diversity and Inclusion",
+      category: "Social",
+      financialImpact: 6,
+      stakeholderImpact: 8,
+      overallScore: 7,
+      justification: "Important for workforce and reputation",
+      evidence: ["Workforce demographics", "D&I programs", "Pay equity analysis"]
+    }
+  ]
+}
 
-  const topics = sectorTopics[sector.toLowerCase()] || sectorTopics.default
+function createFallbackMaterialityResponse(sector: string): MaterialityResponse {
+  const topics = SECTOR_TOPICS[sector.toLowerCase()] || SECTOR_TOPICS.default
 
   return {
     matrix: topics,
@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
 import { withAuth, AuthenticatedRequest } from "@/lib/middleware"
-import ZAI from "z-ai-web-dev-sdk"
+import { getZAI } from "@/lib/ai-client"
 import { createDemoReport, getDemoProject } from "@/lib/mvp-demo-store"
 
 interface ReportGenerationRequest {
@@ -177,6 +177,9 @@ const POSTHandler = async (
       })
     }
 
+    // Start SDK initialisation so it overlaps with the project lookup
+    const zaiClient = getZAI()
+
     // Check if project exists
     const project = await db.project.findUnique({
       where: { id: projectId },
@@ -208,7 +211,7 @@ const POSTHandler = async (
     }
 
     // Initialize ZAI SDK
-    const zai = await ZAI.create()
+    const zai = await zaiClient
 
     // Get the latest report version
     const latestReport = project.reports[0]
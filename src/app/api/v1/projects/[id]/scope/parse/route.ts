@@ -1,7 +1,7 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
 import { withAuth, AuthenticatedRequest } from "@/lib/middleware"
-import ZAI from "z-ai-web-dev-sdk"
+import { getZAI } from "@/lib/ai-client"
 import { getDemoProject, updateDemoProject } from "@/lib/mvp-demo-store"
 
 interface ScopeParseRequest {
@@ -89,6 +89,9 @@ const POSTHandler = async (
       })
     }
 
+    // Start SDK initialisation so it overlaps with the project lookup
+    const zaiClient = getZAI()
+
     // Check if project exists
     const project = await db.project.findUnique({
       where: { id: projectId }
@@ -102,7 +105,7 @@ const POSTHandler = async (
     }
 
     // Initialize ZAI SDK
-    const zai = await ZAI.create()
+    const zai = await zaiClient
 
     // Create the system prompt for scope parsing
     const systemPrompt = `You are the ESG Pathfinder mapping agent. Input: free-text company scope, location, sector, and optional attachments. Task: extract structured scope JSON {entities[], activities[], geographies[], timeframes[]} and map each extracted item to canonical ESG taxonomy entries (GRI topic IDs, SASB topics, or jurisdictional clause IDs). For each mapping include: mapping_id, mapping_label, confidence_score (0-1), match_evidence (text span or clause id), transform_rules_applied. If confidence < 0.75, include suggested user-editable alternatives (max 3). Provide a human-readable rationale sentence per mapping. Output strictly as JSON. Use the latest regulatory library and cite clause IDs where applicable. Do not hallucinate. If an item cannot be mapped, mark as unmapped and propose a best-effort standard term with low confidence.`
@@ -72,8 +72,10 @@ const GETHandler = async (
       db.iSSBAssessment.findUnique({ where: { projectId } }),
       db.gRIAssessment.findUnique({ where: { projectId } }),
       db.sASBAssessment.findUnique({ where: { projectId } }),
-      db.eSGDataPoint.findMany({ where: { projectId }, select: { metricCode: true } }),
-      db.complianceCheck.findMany({ where: { projectId }, select: { framework: true } }),
+      // Readiness only needs which codes/frameworks exist, so let the database
+      // collapse duplicates instead of returning every row
+      db.eSGDataPoint.groupBy({ by: ['metricCode'], where: { projectId } }),
+      db.complianceCheck.groupBy({ by: ['framework'], where: { projectId } }),
       db.evidence.count({ where: { projectId } }),
       db.report.count({ where: { projectId } }),
       db.workflow.count({ where: { projectId } })
@@ -1,8 +1,8 @@
 import { NextRequest, NextResponse } from "next/server"
 import { db } from "@/lib/db"
-import ZAI from "z-ai-web-dev-sdk"
 import { z } from "zod"
 import { withAuth, AuthenticatedRequest } from "@/lib/middleware"
+import { getZAI } from "@/lib/ai-client"
 import { UserRole } from "@prisma/client"
 
 const tcfdAssessmentSchema = z.object({
@@ -91,8 +91,7 @@ const tcfdAssessmentHandler = async (
     const project = await db.project.findUnique({
       where: { id: projectId },
       include: {
-        organisation: true,
-        scopeStructuredJson: true
+        organisation: true
       }
     })
 
@@ -129,7 +128,7 @@ const tcfdAssessmentHandler = async (
     }
 
     // Calculate overall score and generate recommendations
-    const { overallScore, recommendations } = await calculateTCFDScore(assessmentData, project)
+    const { overallScore, recommendations } = calculateTCFDScore(assessmentData, project)
 
     // Create or update TCFD assessment
     const tcfdAssessment = await db.tCFDAssessment.upsert({
@@ -279,7 +278,7 @@ export const POST = withAuth(tcfdAssessmentHandler)
 export const GET = withAuth(getTCFDAssessmentHandler)
 
 async function generateTCFDFromScope(project: any): Promise<any> {
-  const zai = await ZAI.create()
+  const zai = await getZAI()
 
   const systemPrompt = `You are a TCFD (Task Force on Climate-related Financial Disclosures) expert. Your task is to analyze company scope information and generate a comprehensive TCFD assessment covering all four pillars: Governance, Strategy, Risk Management, and Metrics & Targets.
 
@@ -395,83 +394,105 @@ Please analyze this information and generate a comprehensive TCFD assessment tha
   return assessmentData
 }
 
-async function calculateTCFDScore(assessmentData: any, project: any): Promise<{ overallScore: number; recommendations: string[] }> {
+// Each criterion awards points when the field is present, or when it is
+// longer than minLength for free-text and list fields.
+interface TCFDCriterion {
+  field: string
+  points: number
+  minLength?: number
+}
+
+interface TCFDScoringSection {
+  key: string
+  weight: number
+  threshold: number
+  criteria: TCFDCriterion[]
+  weakRecommendation: string
+  missingRecommendation: string
+}
+
+const TCFD_SCORING_SECTIONS: TCFDScoringSection[] = [
+  {
+    // Governance scoring (25% of total)
+    key: "governance",
+    weight: 0.25,
+    threshold: 15,
+    criteria: [
+      { field: "boardOversight", points: 8 },
+      { field: "managementResponsibility", points: 8 },
+      { field: "climateCompetency", points: 6 },
+      { field: "governanceDescription", points: 3, minLength: 100 }
+    ],
+    weakRecommendation: "Strengthen climate governance by establishing board-level oversight and management accountability",
+    missingRecommendation: "Implement climate governance structure with clear board and management responsibilities"
+  },
+  {
+    // Strategy scoring (30% of total)
+    key: "strategy",
+    weight: 0.3,
+    threshold: 20,
+    criteria: [
+      { field: "climateRisks", points: 10, minLength: 0 },
+      { field: "climateOpportunities", points: 8, minLength: 0 },
+      { field: "resilienceAnalysis", points: 7, minLength: 100 },
+      { field: "strategyDescription", points: 5, minLength: 100 }
+    ],
+    weakRecommendation: "Develop comprehensive climate strategy including risk assessment and resilience planning",
+    missingRecommendation: "Create climate strategy addressing both risks and opportunities"
+  },
+  {
+    // Risk Management scoring (25% of total)
+    key: "riskManagement",
+    weight: 0.25,
+    threshold: 15,
+    criteria: [
+      { field: "riskIdentificationProcess", points: 8, minLength: 50 },
+      { field: "riskAssessmentMethodology", points: 7, minLength: 50 },
+      { field: "riskMitigationStrategies", points: 7, minLength: 50 },
+      { field: "integrationInOverallRisk", points: 3 }
+    ],
+    weakRecommendation: "Enhance climate risk management processes and integrate with overall risk framework",
+    missingRecommendation: "Implement climate risk management framework"
+  },
+  {
+    // Metrics & Targets scoring (20% of total)
+    key: "metricsTargets",
+    weight: 0.2,
+    threshold: 12,
+    criteria: [
+      { field: "ghgEmissions", points: 10, minLength: 0 },
+      { field: "climateMetrics", points: 6, minLength: 0 },
+      { field: "targetsDescription", points: 4, minLength: 100 }
+    ],
+    weakRecommendation: "Establish climate-related metrics and targets with clear baselines and timelines",
+    missingRecommendation: "Set climate-related metrics and targets for performance tracking"
+  }
+]
+
+function calculateTCFDScore(assessmentData: any, project: any): { overallScore: number; recommendations: string[] } {
   let score = 0
   const recommendations: string[] = []
 
-  // Governance scoring (25% of total)
-  if (assessmentData?.governance) {
-    const gov = assessmentData.governance
-    let govScore = 0
-    
-    if (gov.boardOversight) govScore += 8
-    if (gov.managementResponsibility) govScore += 8
-    if (gov.climateCompetency) govScore += 6
-    if (gov.governanceDescription && gov.governanceDescription.length > 100) govScore += 3
-    
-    score += govScore * 0.25
-    
-    if (govScore < 15) {
-      recommendations.push("Strengthen climate governance by establishing board-level oversight and management accountability")
+  for (const section of TCFD_SCORING_SECTIONS) {
+    const values = assessmentData?.[section.key]
+    if (!values) {
+      recommendations.push(section.missingRecommendation)
+      continue
     }
-  } else {
-    recommendations.push("Implement climate governance structure with clear board and management responsibilities")
-  }
 
-  // Strategy scoring (30% of total)
-  if (assessmentData?.strategy) {
-    const strat = assessmentData.strategy
-    let stratScore = 0
-    
-    if (strat.climateRisks && strat.climateRisks.length > 0) stratScore += 10
-    if (strat.climateOpportunities && strat.climateOpportunities.length > 0) stratScore += 8
-    if (strat.resilienceAnalysis && strat.resilienceAnalysis.length > 100) stratScore += 7
-    if (strat.strategyDescription && strat.strategyDescription.length > 100) stratScore += 5
-    
-    score += stratScore * 0.3
-    
-    if (stratScore < 20) {
-      recommendations.push("Develop comprehensive climate strategy including risk assessment and resilience planning")
+    let sectionScore = 0
+    for (const { field, points, minLength } of section.criteria) {
+      const value = values[field]
+      if (value && (minLength === undefined || value.length > minLength)) {
+        sectionScore += points
+      }
     }
-  } else {
-    recommendations.push("Create climate strategy addressing both risks and opportunities")
-  }
 
-  // Risk Management scoring (25% of total)
-  if (assessmentData?.riskManagement) {
-    const risk = assessmentData.riskManagement
-    let riskScore = 0
-    
-    if (risk.riskIdentificationProcess && risk.riskIdentificationProcess.length > 50) riskScore += 8
-    if (risk.riskAssessmentMethodology && risk.riskAssessmentMethodology.length > 50) riskScore += 7
-    if (risk.riskMitigationStrategies && risk.riskMitigationStrategies.length > 50) riskScore += 7
-    if (risk.integrationInOverallRisk) riskScore += 3
-    
-    score += riskScore * 0.25
-    
-    if (riskScore < 15) {
-      recommendations.push("Enhance climate risk management processes and integrate with overall risk framework")
-    }
-  } else {
-    recommendations.push("Implement climate risk management framework")
-  }
+    score += sectionScore * section.weight
 
-  // Metrics & Targets scoring (20% of total)
-  if (assessmentData?.metricsTargets) {
-    const metrics = assessmentData.metricsTargets
-    let metricsScore = 0
-    
-    if (metrics.ghgEmissions && metrics.ghgEmissions.length > 0) metricsScore += 10
-    if (metrics.climateMetrics && metrics.climateMetrics.length > 0) metricsScore += 6
-    if (metrics.targetsDescription && metrics.targetsDescription.length > 100) metricsScore += 4
-    
-    score += metricsScore * 0.2
-    
-    if (metricsScore < 12) {
-      recommendations.push("Establish climate-related metrics and targets with clear baselines and timelines")
+    if (sectionScore < section.threshold) {
+      recommendations.push(section.weakRecommendation)
     }
-  } else {
-    recommendations.push("Set climate-related metrics and targets for performance tracking")
   }
 
   // Industry-specific recommendations
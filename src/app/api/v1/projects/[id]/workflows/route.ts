@@ -80,8 +80,8 @@ const POSTHandler = async (
     // Validate workflow data
     const validatedData = workflowSchema.parse(workflowData)
 
-    // Create workflow
-    const workflow = await db.workflow.create({
+    // Create the workflow with its tasks and approvals in one nested write
+    const { tasks: createdTasks, approvals: createdApprovals, ...workflow } = await db.workflow.create({
       data: {
         projectId,
         name: validatedData.name,
@@ -89,44 +89,34 @@ const POSTHandler = async (
         type: validatedData.type,
         assigneeId: validatedData.assigneeId,
         dueDate: validatedData.dueDate ? new Date(validatedData.dueDate) : null,
-        status: "ACTIVE"
-      }
-    })
-
-    // Create tasks if provided
-    const createdTasks: any[] = []
-    if (validatedData.tasks && validatedData.tasks.length > 0) {
-      for (const taskData of validatedData.tasks) {
-        const task = await db.workflowTask.create({
-          data: {
-            workflowId: workflow.id,
-            title: taskData.title,
-            description: taskData.description,
-            type: taskData.type,
-            assigneeId: taskData.assigneeId,
-            dueDate: taskData.dueDate ? new Date(taskData.dueDate) : null
+        status: "ACTIVE",
+        tasks: {
+          createMany: {
+            data: (validatedData.tasks || []).map(taskData => ({
+              title: taskData.title,
+              description: taskData.description,
+              type: taskData.type,
+              assigneeId: taskData.assigneeId,
+              dueDate: taskData.dueDate ? new Date(taskData.dueDate) : null
+            }))
           }
-        })
-        createdTasks.push(task)
-      }
-    }
-
-    // Create approvals if provided
-    const createdApprovals: any[] = []
-    if (validatedData.approvals && validatedData.approvals.length > 0) {
-      for (const approvalData of validatedData.approvals) {
-        const approval = await db.workflowApproval.create({
-          data: {
-            workflowId: workflow.id,
-            level: approvalData.level,
-            title: approvalData.title,
-            description: approvalData.description,
-            assigneeId: approvalData.assigneeId
+        },
+        approvals: {
+          createMany: {
+            data: (validatedData.approvals || []).map(approvalData => ({
+              level: approvalData.level,
+              title: approvalData.title,
+              description: approvalData.description,
+              assigneeId: approvalData.assigneeId
+            }))
           }
-        })
-        createdApprovals.push(approval)
+        }
+      },
+      include: {
+        tasks: true,
+        approvals: true
       }
-    }
+    })
 
     // Log the workflow creation
     await db.auditLog.create({
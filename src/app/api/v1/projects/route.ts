@@ -12,6 +12,7 @@ const logger = new Logger('PROJECTS_API')
 
 const createProjectHandler = withRequestTiming(async (req: AuthenticatedRequest) => {
   const requestId = logger.logAPIRequest(req, req.user?.userId)
+  const requestLogger = logger.withRequestContext(requestId, req.user?.userId)
   const startTime = Date.now()
 
   try {
@@ -43,14 +44,15 @@ const createProjectHandler = withRequestTiming(async (req: AuthenticatedRequest)
       })
     }
 
-    logger.info('Creating project', { 
+    requestLogger.info('Creating project', { 
       projectName: validatedData.name, 
       organisationId: validatedData.organisationId 
     })
 
     // Check if organization exists
     const organisation = await db.organisation.findUnique({
-      where: { id: validatedData.organisationId }
+      where: { id: validatedData.organisationId },
+      select: { id: true }
     })
 
     if (!organisation) {
@@ -75,7 +77,12 @@ const createProjectHandler = withRequestTiming(async (req: AuthenticatedRequest)
         status: "DRAFT",
       },
       include: {
-        organisation: true,
+        organisation: {
+          select: {
+            id: true,
+            name: true,
+          }
+        },
         creator: {
           select: {
             id: true,
@@ -101,7 +108,7 @@ const createProjectHandler = withRequestTiming(async (req: AuthenticatedRequest)
       }
     })
 
-    logger.logBusinessEvent('PROJECT_CREATED', {
+    requestLogger.logBusinessEvent('PROJECT_CREATED', {
       projectId: project.id,
       projectName: project.name,
       userId: req.user!.userId
@@ -113,7 +120,7 @@ const createProjectHandler = withRequestTiming(async (req: AuthenticatedRequest)
       message: "Project created successfully"
     })
 
-    logger.logAPIResponse(req, 201, Date.now() - startTime)
+    requestLogger.logAPIResponse(req, 201, Date.now() - startTime)
     return response
 
   } catch (error) {
@@ -182,7 +189,12 @@ const getProjectsHandler = async (req: AuthenticatedRequest) => {
       db.project.findMany({
         where: whereClause,
         include: {
-          organisation: true,
+          organisation: {
+            select: {
+              id: true,
+              name: true,
+            }
+          },
           creator: {
             select: {
               id: true,
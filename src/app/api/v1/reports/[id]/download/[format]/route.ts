@@ -4,16 +4,22 @@ import { withAuth, AuthenticatedRequest } from '@/lib/middleware'
 import { UserRole } from '@prisma/client'
 import { getDemoProject, getDemoReport } from '@/lib/mvp-demo-store'
 
-const mimeByFormat: Record<string, string> = {
-  json: 'application/json',
-  xbrl: 'application/xml',
-  xml: 'application/xml'
+interface DownloadFormat {
+  mime: string
+  extension: string
+  usesXbrl: boolean
 }
 
-const extensionByFormat: Record<string, string> = {
-  json: 'json',
-  xbrl: 'xbrl',
-  xml: 'xml'
+const downloadFormats = new Map<string, DownloadFormat>([
+  ['json', { mime: 'application/json', extension: 'json', usesXbrl: false }],
+  ['xbrl', { mime: 'application/xml', extension: 'xbrl', usesXbrl: true }],
+  ['xml', { mime: 'application/xml', extension: 'xml', usesXbrl: true }]
+])
+
+const WHITESPACE_RUN = /\s+/g
+
+function reportFilename(projectName: string, version: number, format: DownloadFormat): string {
+  return `${projectName.replace(WHITESPACE_RUN, '-').toLowerCase()}-report-v${version}.${format.extension}`
 }
 
 async function handler(
@@ -22,8 +28,10 @@ async function handler(
 ) {
   try {
     const { id, format } = await params
-    const normalizedFormat = format.toLowerCase()
-
+    const downloadFormat = downloadFormats.get(format.toLowerCase())
+    if (!downloadFormat) {
+      return NextResponse.json({ error: 'Unsupported format' }, { status: 400 })
+    }
 
     if (!process.env.DATABASE_URL) {
       const report = getDemoReport(id)
@@ -31,33 +39,33 @@ async function handler(
         return NextResponse.json({ error: 'Report not found' }, { status: 404 })
       }
 
-      if (!['json', 'xbrl', 'xml'].includes(normalizedFormat)) {
-        return NextResponse.json({ error: 'Unsupported format' }, { status: 400 })
-      }
-
-      if ((normalizedFormat === 'xbrl' || normalizedFormat === 'xml') && !report.xbrlContent) {
+      if (downloadFormat.usesXbrl && !report.xbrlContent) {
         return NextResponse.json({ error: 'XBRL content not available for this report' }, { status: 404 })
       }
 
       const project = getDemoProject(report.projectId)
-      const content = normalizedFormat === 'json'
+      const content = !downloadFormat.usesXbrl
         ? JSON.stringify(report.contentJson, null, 2)
         : report.xbrlContent!
 
-      const filename = `${(project?.name || 'demo-project').replace(/\s+/g, '-').toLowerCase()}-report-v${report.version}.${extensionByFormat[normalizedFormat]}`
+      const filename = reportFilename(project?.name || 'demo-project', report.version, downloadFormat)
 
       return new NextResponse(content, {
         status: 200,
         headers: {
-          'Content-Type': `${mimeByFormat[normalizedFormat]}; charset=utf-8`,
+          'Content-Type': `${downloadFormat.mime}; charset=utf-8`,
           'Content-Disposition': `attachment; filename="${filename}"`
         }
       })
     }
 
+    // Only load the payload column this format serves; both can be large
     const report = await db.report.findUnique({
       where: { id },
-      include: {
+      select: {
+        version: true,
+        contentJson: !downloadFormat.usesXbrl,
+        xbrlContent: downloadFormat.usesXbrl,
         project: {
           select: {
             createdBy: true,
@@ -76,24 +84,20 @@ async function handler(
       return NextResponse.json({ error: 'Insufficient permissions' }, { status: 403 })
     }
 
-    if (!['json', 'xbrl', 'xml'].includes(normalizedFormat)) {
-      return NextResponse.json({ error: 'Unsupported format' }, { status: 400 })
-    }
-
-    if ((normalizedFormat === 'xbrl' || normalizedFormat === 'xml') && !report.xbrlContent) {
+    if (downloadFormat.usesXbrl && !report.xbrlContent) {
       return NextResponse.json({ error: 'XBRL content not available for this report' }, { status: 404 })
     }
 
-    const content = normalizedFormat === 'json'
+    const content = !downloadFormat.usesXbrl
       ? JSON.stringify(report.contentJson, null, 2)
       : report.xbrlContent!
 
-    const filename = `${report.project.name.replace(/\s+/g, '-').toLowerCase()}-report-v${report.version}.${extensionByFormat[normalizedFormat]}`
+    const filename = reportFilename(report.project.name, report.version, downloadFormat)
 
     return new NextResponse(content, {
       status: 200,
       headers: {
-        'Content-Type': `${mimeByFormat[normalizedFormat]}; charset=utf-8`,
+        'Content-Type': `${downloadFormat.mime}; charset=utf-8`,
         'Content-Disposition': `attachment; filename="${filename}"`
       }
     })
@@ -12,8 +12,13 @@ async function handler(req: AuthenticatedRequest) {
 
     if (!process.env.DATABASE_URL) {
       const demoReports = listDemoReports(projectId)
+      // Reports share projects, so resolve each project once per request
+      const projectsById = new Map<string, ReturnType<typeof getDemoProject>>()
       const data = demoReports.map((report) => {
-        const project = getDemoProject(report.projectId)
+        if (!projectsById.has(report.projectId)) {
+          projectsById.set(report.projectId, getDemoProject(report.projectId))
+        }
+        const project = projectsById.get(report.projectId)
         return {
           ...report,
           project: {
@@ -1,4 +1,5 @@
 import { NextResponse } from 'next/server'
+import { Prisma } from '@prisma/client'
 import { db } from '@/lib/db'
 import { withAuth, AuthenticatedRequest } from '@/lib/middleware'
 import { findDemoUserById, upsertDemoUser } from '@/lib/mvp-demo-store'
@@ -116,36 +117,37 @@ async function putHandler(req: AuthenticatedRequest) {
       })
     }
 
-    const existingUser = await db.user.findUnique({
-      where: { id: req.user!.userId },
-      select: { metadata: true }
-    })
+    // Preferences are merged into the stored metadata, so only that update
+    // shape needs the existing row; name-only updates go straight to the write.
+    let metadata: Prisma.InputJsonObject | undefined
+    if (preferences !== undefined) {
+      const existingUser = await db.user.findUnique({
+        where: { id: req.user!.userId },
+        select: { metadata: true }
+      })
 
-    if (!existingUser) {
-      return NextResponse.json({ error: 'User not found' }, { status: 404 })
-    }
+      if (!existingUser) {
+        return NextResponse.json({ error: 'User not found' }, { status: 404 })
+      }
 
-    const existingMetadata = (existingUser.metadata && typeof existingUser.metadata === 'object')
-      ? (existingUser.metadata as Record<string, unknown>)
-      : {}
+      const existingMetadata = (existingUser.metadata && typeof existingUser.metadata === 'object')
+        ? (existingUser.metadata as Prisma.JsonObject)
+        : {}
 
-    const existingPreferences = getPreferences(existingUser.metadata)
+      metadata = {
+        ...existingMetadata,
+        preferences: {
+          ...getPreferences(existingUser.metadata),
+          ...preferences
+        }
+      }
+    }
 
     const updated = await db.user.update({
       where: { id: req.user!.userId },
       data: {
         ...(name !== undefined ? { name } : {}),
-        ...(preferences !== undefined
-          ? {
-              metadata: {
-                ...existingMetadata,
-                preferences: {
-                  ...existingPreferences,
-                  ...preferences
-                }
-              }
-            }
-          : {})
+        ...(metadata !== undefined ? { metadata } : {})
       },
       select: {
         id: true,
@@ -171,6 +173,9 @@ async function putHandler(req: AuthenticatedRequest) {
       }
     })
   } catch (error) {
+    if ((error as { code?: string })?.code === 'P2025') {
+      return NextResponse.json({ error: 'User not found' }, { status: 404 })
+    }
     console.error('Error updating settings:', error)
     return NextResponse.json({ error: 'Failed to update settings' }, { status: 500 })
   }
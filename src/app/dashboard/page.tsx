@@ -16,6 +16,7 @@ import { Alert, AlertDescription } from "@/components/ui/alert"
 import Link from "next/link"
 import { useAuth } from "@/contexts/auth-context"
 import { ProtectedRoute } from "@/components/protected-route"
+import { apiFetch, apiGetCached, invalidateApiCache } from "@/lib/api-client"
 
 type Project = {
   id: string
@@ -43,37 +44,79 @@ const statusProgress: Record<string, number> = {
   COMPLETED: 100
 }
 
+type NewProjectForm = {
+  name: string
+  description: string
+  organisationId: string
+}
+
+const emptyProjectForm: NewProjectForm = { name: "", description: "", organisationId: "" }
+
+// Owns its form state so typing in the dialog re-renders only the dialog,
+// not the dashboard's project table.
+function CreateProjectDialog({ organisations, isCreating, onCreate }: {
+  organisations: Array<{ id: string; name: string }>
+  isCreating: boolean
+  onCreate: (project: NewProjectForm) => Promise<boolean>
+}) {
+  const [isOpen, setIsOpen] = useState(false)
+  const [newProject, setNewProject] = useState<NewProjectForm>(emptyProjectForm)
+
+  const handleSubmit = async () => {
+    if (await onCreate(newProject)) {
+      setNewProject(emptyProjectForm)
+      setIsOpen(false)
+    }
+  }
+
+  return (
+    <Dialog open={isOpen} onOpenChange={setIsOpen}>
+      <DialogTrigger asChild><Button><Plus className="h-4 w-4 mr-2" />New Project</Button></DialogTrigger>
+      <DialogContent className="sm:max-w-[425px]">
+        <DialogHeader>
+          <DialogTitle>Create New Project</DialogTitle>
+          <DialogDescription>Create a new ESG compliance project for your organization.</DialogDescription>
+        </DialogHeader>
+        <div className="grid gap-4 py-4">
+          <div className="grid gap-2">
+            <Label htmlFor="name">Project Name</Label>
+            <Input id="name" value={newProject.name} onChange={(e) => setNewProject({ ...newProject, name: e.target.value })} placeholder="Enter project name" />
+          </div>
+          <div className="grid gap-2">
+            <Label htmlFor="organisation">Organization</Label>
+            <Select value={newProject.organisationId} onValueChange={(value) => setNewProject({ ...newProject, organisationId: value })}>
+              <SelectTrigger><SelectValue placeholder="Select organization" /></SelectTrigger>
+              <SelectContent>
+                {organisations.map((org) => (
+                  <SelectItem key={org.id} value={org.id}>{org.name}</SelectItem>
+                ))}
+              </SelectContent>
+            </Select>
+          </div>
+          <div className="grid gap-2">
+            <Label htmlFor="description">Description</Label>
+            <Textarea id="description" value={newProject.description} onChange={(e) => setNewProject({ ...newProject, description: e.target.value })} placeholder="Enter project description" />
+          </div>
+        </div>
+        <DialogFooter><Button onClick={handleSubmit} disabled={isCreating}>{isCreating ? <Loader2 className="h-4 w-4 mr-2 animate-spin" /> : null}Create Project</Button></DialogFooter>
+      </DialogContent>
+    </Dialog>
+  )
+}
+
 export default function Dashboard() {
   const { isAdmin, user, token, logout } = useAuth()
   const [projects, setProjects] = useState<Project[]>([])
   const [searchTerm, setSearchTerm] = useState("")
-  const [isCreateDialogOpen, setIsCreateDialogOpen] = useState(false)
   const [isLoading, setIsLoading] = useState(true)
   const [isCreating, setIsCreating] = useState(false)
   const [error, setError] = useState<string | null>(null)
-  const [newProject, setNewProject] = useState({
-    name: "",
-    description: "",
-    organisationId: ""
-  })
-
-  const authHeaders = useMemo(() => {
-    const headers: Record<string, string> = {}
-    if (token) headers.Authorization = `Bearer ${token}`
-    return headers
-  }, [token])
 
   const loadProjects = async () => {
-    const response = await fetch('/api/v1/projects?limit=100', {
-      credentials: 'include',
-      headers: authHeaders
+    const data = await apiGetCached('/api/v1/projects?limit=100', {
+      token,
+      errorMessage: 'Failed to load projects'
     })
-
-    if (!response.ok) {
-      throw new Error('Failed to load projects')
-    }
-
-    const data = await response.json()
     setProjects(data.data || [])
   }
 
@@ -92,32 +135,48 @@ export default function Dashboard() {
     bootstrap()
   }, [token])
 
-  const filteredProjects = projects.filter(project =>
-    project.name.toLowerCase().includes(searchTerm.toLowerCase()) ||
-    (project.organisation?.name || '').toLowerCase().includes(searchTerm.toLowerCase())
-  )
+  // One pass over the list for all status cards
+  const statusCounts = useMemo(() => {
+    const counts: Record<string, number> = {}
+    for (const project of projects) {
+      counts[project.status] = (counts[project.status] || 0) + 1
+    }
+    return counts
+  }, [projects])
 
-  const handleCreateProject = async () => {
+  // Search keys and date labels only change with the project list, so derive
+  // them once rather than on every keystroke in the search box
+  const projectRows = useMemo(() => projects.map(project => ({
+    project,
+    nameKey: project.name.toLowerCase(),
+    organisationKey: (project.organisation?.name || '').toLowerCase(),
+    createdLabel: new Date(project.createdAt).toLocaleDateString(),
+    updatedLabel: new Date(project.updatedAt).toLocaleDateString()
+  })), [projects])
+
+  const filteredRows = useMemo(() => {
+    const term = searchTerm.toLowerCase()
+    if (!term) return projectRows
+    return projectRows.filter(row => row.nameKey.includes(term) || row.organisationKey.includes(term))
+  }, [projectRows, searchTerm])
+
+  const handleCreateProject = async (newProject: NewProjectForm) => {
     if (!newProject.name || !newProject.organisationId) {
       setError('Project name and organization are required')
-      return
+      return false
     }
 
     try {
       setIsCreating(true)
       setError(null)
-      const response = await fetch('/api/v1/projects', {
+      const response = await apiFetch('/api/v1/projects', {
+        token,
         method: 'POST',
-        credentials: 'include',
-        headers: {
-          'Content-Type': 'application/json',
-          ...authHeaders
-        },
-        body: JSON.stringify({
+        body: {
           name: newProject.name,
           scopeRaw: newProject.description,
           organisationId: newProject.organisationId
-        })
+        }
       })
 
       if (!response.ok) {
@@ -125,11 +184,12 @@ export default function Dashboard() {
         throw new Error(data.error || 'Failed to create project')
       }
 
+      invalidateApiCache('/api/v1/projects')
       await loadProjects()
-      setNewProject({ name: "", description: "", organisationId: "" })
-      setIsCreateDialogOpen(false)
+      return true
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Unable to create project')
+      return false
     } finally {
       setIsCreating(false)
     }
@@ -202,9 +262,9 @@ export default function Dashboard() {
 
           <div className="grid grid-cols-1 md:grid-cols-4 gap-6 mb-8">
             <Card><CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2"><CardTitle className="text-sm font-medium">Total Projects</CardTitle><FileText className="h-4 w-4 text-muted-foreground" /></CardHeader><CardContent><div className="text-2xl font-bold">{projects.length}</div><p className="text-xs text-muted-foreground">All tracked ESG projects</p></CardContent></Card>
-            <Card><CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2"><CardTitle className="text-sm font-medium">Active Projects</CardTitle><div className="h-2 w-2 rounded-full bg-green-600"></div></CardHeader><CardContent><div className="text-2xl font-bold">{projects.filter(p => p.status === 'ACTIVE').length}</div><p className="text-xs text-muted-foreground">Currently in progress</p></CardContent></Card>
-            <Card><CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2"><CardTitle className="text-sm font-medium">In Review</CardTitle><div className="h-2 w-2 rounded-full bg-yellow-500"></div></CardHeader><CardContent><div className="text-2xl font-bold">{projects.filter(p => p.status === 'REVIEW').length}</div><p className="text-xs text-muted-foreground">Pending review</p></CardContent></Card>
-            <Card><CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2"><CardTitle className="text-sm font-medium">Completed</CardTitle><div className="h-2 w-2 rounded-full bg-blue-500"></div></CardHeader><CardContent><div className="text-2xl font-bold">{projects.filter(p => p.status === 'COMPLETED').length}</div><p className="text-xs text-muted-foreground">Finished assessments</p></CardContent></Card>
+            <Card><CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2"><CardTitle className="text-sm font-medium">Active Projects</CardTitle><div className="h-2 w-2 rounded-full bg-green-600"></div></CardHeader><CardContent><div className="text-2xl font-bold">{statusCounts.ACTIVE || 0}</div><p className="text-xs text-muted-foreground">Currently in progress</p></CardContent></Card>
+            <Card><CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2"><CardTitle className="text-sm font-medium">In Review</CardTitle><div className="h-2 w-2 rounded-full bg-yellow-500"></div></CardHeader><CardContent><div className="text-2xl font-bold">{statusCounts.REVIEW || 0}</div><p className="text-xs text-muted-foreground">Pending review</p></CardContent></Card>
+            <Card><CardHeader className="flex flex-row items-center justify-between space-y-0 pb-2"><CardTitle className="text-sm font-medium">Completed</CardTitle><div className="h-2 w-2 rounded-full bg-blue-500"></div></CardHeader><CardContent><div className="text-2xl font-bold">{statusCounts.COMPLETED || 0}</div><p className="text-xs text-muted-foreground">Finished assessments</p></CardContent></Card>
           </div>
 
           <Card>
@@ -214,37 +274,11 @@ export default function Dashboard() {
                   <CardTitle>Projects</CardTitle>
                   <CardDescription>Manage your ESG compliance projects and assessments</CardDescription>
                 </div>
-                <Dialog open={isCreateDialogOpen} onOpenChange={setIsCreateDialogOpen}>
-                  <DialogTrigger asChild><Button><Plus className="h-4 w-4 mr-2" />New Project</Button></DialogTrigger>
-                  <DialogContent className="sm:max-w-[425px]">
-                    <DialogHeader>
-                      <DialogTitle>Create New Project</DialogTitle>
-                      <DialogDescription>Create a new ESG compliance project for your organization.</DialogDescription>
-                    </DialogHeader>
-                    <div className="grid gap-4 py-4">
-                      <div className="grid gap-2">
-                        <Label htmlFor="name">Project Name</Label>
-                        <Input id="name" value={newProject.name} onChange={(e) => setNewProject({ ...newProject, name: e.target.value })} placeholder="Enter project name" />
-                      </div>
-                      <div className="grid gap-2">
-                        <Label htmlFor="organisation">Organization</Label>
-                        <Select value={newProject.organisationId} onValueChange={(value) => setNewProject({ ...newProject, organisationId: value })}>
-                          <SelectTrigger><SelectValue placeholder="Select organization" /></SelectTrigger>
-                          <SelectContent>
-                            {(user?.organisations || []).map((org) => (
-                              <SelectItem key={org.id} value={org.id}>{org.name}</SelectItem>
-                            ))}
-                          </SelectContent>
-                        </Select>
-                      </div>
-                      <div className="grid gap-2">
-                        <Label htmlFor="description">Description</Label>
-                        <Textarea id="description" value={newProject.description} onChange={(e) => setNewProject({ ...newProject, description: e.target.value })} placeholder="Enter project description" />
-                      </div>
-                    </div>
-                    <DialogFooter><Button onClick={handleCreateProject} disabled={isCreating}>{isCreating ? <Loader2 className="h-4 w-4 mr-2 animate-spin" /> : null}Create Project</Button></DialogFooter>
-                  </DialogContent>
-                </Dialog>
+                <CreateProjectDialog
+                  organisations={user?.organisations || []}
+                  isCreating={isCreating}
+                  onCreate={handleCreateProject}
+                />
               </div>
             </CardHeader>
             <CardContent>
@@ -272,7 +306,7 @@ export default function Dashboard() {
                     </TableRow>
                   </TableHeader>
                   <TableBody>
-                    {filteredProjects.map((project) => {
+                    {filteredRows.map(({ project, createdLabel, updatedLabel }) => {
                       const progress = statusProgress[project.status] || 0
                       return (
                         <TableRow key={project.id}>
@@ -285,8 +319,8 @@ export default function Dashboard() {
                               <span className="text-sm text-slate-600">{progress}%</span>
                             </div>
                           </TableCell>
-                          <TableCell>{new Date(project.createdAt).toLocaleDateString()}</TableCell>
-                          <TableCell>{new Date(project.updatedAt).toLocaleDateString()}</TableCell>
+                          <TableCell>{createdLabel}</TableCell>
+                          <TableCell>{updatedLabel}</TableCell>
                           <TableCell>
                             <DropdownMenu>
                               <DropdownMenuTrigger asChild><Button variant="ghost" className="h-8 w-8 p-0"><MoreHorizontal className="h-4 w-4" /></Button></DropdownMenuTrigger>
@@ -300,7 +334,7 @@ export default function Dashboard() {
                         </TableRow>
                       )
                     })}
-                    {!filteredProjects.length && (
+                    {!filteredRows.length && (
                       <TableRow>
                         <TableCell colSpan={7} className="text-center py-10 text-slate-500">No projects found.</TableCell>
                       </TableRow>
@@ -39,10 +39,84 @@ import {
 } from "lucide-react"
 import Link from "next/link"
 import { useAuth } from "@/contexts/auth-context"
+import { apiFetch, apiGetCached, invalidateApiCache } from "@/lib/api-client"
 import { ProtectedRoute } from "@/components/protected-route"
 
 type ProjectOption = { id: string; name: string; status: string }
 
+// Sample materiality matrix points, keyed by "x,y" so each of the 100 grid
+// cells is a single lookup
+const sampleMatrixPoints = new Map(
+  [
+    { x: 8, y: 9, label: "Climate Change", size: "large" },
+    { x: 7, y: 8, label: "Data Privacy", size: "medium" },
+    { x: 9, y: 6, label: "Energy Use", size: "medium" },
+    { x: 6, y: 7, label: "Diversity", size: "small" },
+    { x: 5, y: 5, label: "Supply Chain", size: "small" }
+  ].map((point) => [`${point.x},${point.y}`, point])
+)
+
+// Owns the draft text so typing re-renders only this card, not the whole
+// workspace; the page only sees the scope when it is submitted for analysis.
+function ScopeInputCard({ isAnalyzing, canAnalyze, onAnalyze }: {
+  isAnalyzing: boolean
+  canAnalyze: boolean
+  onAnalyze: (rawScope: string) => void
+}) {
+  const [draft, setDraft] = useState("")
+
+  return (
+    <Card>
+      <CardHeader>
+        <CardTitle className="flex items-center space-x-2">
+          <FileText className="h-5 w-5" />
+          <span>Raw Scope Input</span>
+        </CardTitle>
+        <CardDescription>
+          Enter your company's scope, activities, and regulatory context in natural language
+        </CardDescription>
+      </CardHeader>
+      <CardContent className="space-y-4">
+        <div className="space-y-2">
+          <Label htmlFor="raw-scope">Scope Description</Label>
+          <Textarea
+            id="raw-scope"
+            placeholder="Enter your company scope, including activities, geographies, facilities, metrics, and timelines..."
+            value={draft}
+            onChange={(e) => setDraft(e.target.value)}
+            rows={8}
+          />
+        </div>
+        
+        <Alert>
+          <Lightbulb className="h-4 w-4" />
+          <AlertDescription>
+            <strong>Tip:</strong> Include information about your company's main activities, operating regions, size, and any specific ESG frameworks you're considering.
+          </AlertDescription>
+        </Alert>
+
+        <Button 
+          onClick={() => onAnalyze(draft)}
+          disabled={!draft.trim() || isAnalyzing || !canAnalyze}
+          className="w-full"
+        >
+          {isAnalyzing ? (
+            <>
+              <Loader2 className="h-4 w-4 mr-2 animate-spin" />
+              Analyzing Scope...
+            </>
+          ) : (
+            <>
+              <Target className="h-4 w-4 mr-2" />
+              Analyze Scope
+            </>
+          )}
+        </Button>
+      </CardContent>
+    </Card>
+  )
+}
+
 export default function ProjectWorkspace() {
   const { token } = useAuth()
   const [projects, setProjects] = useState<ProjectOption[]>([])
@@ -58,25 +132,13 @@ export default function ProjectWorkspace() {
   const [isLoadingMvpData, setIsLoadingMvpData] = useState(false)
   const [isGeneratingReport, setIsGeneratingReport] = useState(false)
 
-  const headers = useMemo(() => {
-    const authHeaders: Record<string, string> = {}
-    if (token) authHeaders.Authorization = `Bearer ${token}`
-    return authHeaders
-  }, [token])
-
   useEffect(() => {
     const loadProjects = async () => {
       try {
-        const response = await fetch('/api/v1/projects?limit=100', {
-          credentials: 'include',
-          headers
+        const data = await apiGetCached('/api/v1/projects?limit=100', {
+          token,
+          errorMessage: 'Failed to load projects'
         })
-
-        if (!response.ok) {
-          throw new Error('Failed to load projects')
-        }
-
-        const data = await response.json()
         const items = (data.data || []).map((project: any) => ({
           id: project.id,
           name: project.name,
@@ -93,33 +155,35 @@ export default function ProjectWorkspace() {
     }
 
     loadProjects()
-  }, [headers])
+  }, [token])
 
-  const selectedProject = projects.find((project) => project.id === selectedProjectId)
+  const selectedProject = useMemo(
+    () => projects.find((project) => project.id === selectedProjectId),
+    [projects, selectedProjectId]
+  )
 
-  const loadMvpData = async (projectId: string) => {
+  const loadMvpData = async (projectId: string, force = false) => {
     try {
       setIsLoadingMvpData(true)
 
-      const [readinessResponse, reportsResponse] = await Promise.all([
-        fetch(`/api/v1/projects/${projectId}/standards/readiness`, {
-          credentials: 'include',
-          headers
-        }),
-        fetch(`/api/v1/reports?projectId=${projectId}`, {
-          credentials: 'include',
-          headers
-        })
+      // Cached per project, so switching back and forth between projects
+      // does not refetch; report generation and Refresh invalidate first.
+      if (force) {
+        invalidateApiCache(`/api/v1/projects/${projectId}/standards/readiness`)
+        invalidateApiCache(`/api/v1/reports?projectId=${projectId}`)
+      }
+
+      const [readinessResult, reportsResult] = await Promise.allSettled([
+        apiGetCached(`/api/v1/projects/${projectId}/standards/readiness`, { token }),
+        apiGetCached(`/api/v1/reports?projectId=${projectId}`, { token })
       ])
 
-      if (readinessResponse.ok) {
-        const readinessData = await readinessResponse.json()
-        setReadinessSummary(readinessData.data)
+      if (readinessResult.status === 'fulfilled') {
+        setReadinessSummary(readinessResult.value.data)
       }
 
-      if (reportsResponse.ok) {
-        const reportsData = await reportsResponse.json()
-        setLatestReport((reportsData.data || [])[0] || null)
+      if (reportsResult.status === 'fulfilled') {
+        setLatestReport((reportsResult.value.data || [])[0] || null)
       }
     } catch (error) {
       setErrorMessage(error instanceof Error ? error.message : 'Failed to load project readiness')
@@ -134,21 +198,18 @@ export default function ProjectWorkspace() {
     }
   }, [selectedProjectId])
 
-  const handleAnalyzeScope = async () => {
-    if (!rawScope.trim() || !selectedProjectId) return
+  const handleAnalyzeScope = async (scopeText: string) => {
+    if (!scopeText.trim() || !selectedProjectId) return
 
+    setRawScope(scopeText)
     setIsAnalyzing(true)
     setErrorMessage(null)
 
     try {
-      const response = await fetch(`/api/v1/projects/${selectedProjectId}/scope/parse`, {
+      const response = await apiFetch(`/api/v1/projects/${selectedProjectId}/scope/parse`, {
+        token,
         method: 'POST',
-        credentials: 'include',
-        headers: {
-          'Content-Type': 'application/json',
-          ...headers
-        },
-        body: JSON.stringify({ rawScope })
+        body: { rawScope: scopeText }
       })
 
       if (!response.ok) {
@@ -202,18 +263,14 @@ export default function ProjectWorkspace() {
 
     try {
       setIsGeneratingReport(true)
-      const response = await fetch(`/api/v1/projects/${selectedProjectId}/report/generate`, {
+      const response = await apiFetch(`/api/v1/projects/${selectedProjectId}/report/generate`, {
+        token,
         method: 'POST',
-        credentials: 'include',
-        headers: {
-          'Content-Type': 'application/json',
-          ...headers
-        },
-        body: JSON.stringify({
+        body: {
           format: 'json',
           includeXBRL: true,
           sections: ['executive_summary', 'environmental', 'social', 'governance']
-        })
+        }
       })
 
       if (!response.ok) {
@@ -221,6 +278,7 @@ export default function ProjectWorkspace() {
         throw new Error(err.error || 'Failed to generate report')
       }
 
+      invalidateApiCache('/api/v1/reports')
       await loadMvpData(selectedProjectId)
     } catch (error) {
       setErrorMessage(error instanceof Error ? error.message : 'Failed to generate report')
@@ -317,7 +375,7 @@ export default function ProjectWorkspace() {
           <CardHeader>
             <CardTitle className="flex items-center justify-between">
               <span>MVP Progress Snapshot</span>
-              <Button size="sm" variant="outline" onClick={() => selectedProjectId && loadMvpData(selectedProjectId)} disabled={!selectedProjectId || isLoadingMvpData}>
+              <Button size="sm" variant="outline" onClick={() => selectedProjectId && loadMvpData(selectedProjectId, true)} disabled={!selectedProjectId || isLoadingMvpData}>
                 {isLoadingMvpData ? <Loader2 className="h-4 w-4 animate-spin" /> : 'Refresh'}
               </Button>
             </CardTitle>
@@ -402,54 +460,11 @@ export default function ProjectWorkspace() {
           <TabsContent value="scope" className="space-y-6">
             <div className="grid lg:grid-cols-2 gap-6">
               {/* Raw Scope Input */}
-              <Card>
-                <CardHeader>
-                  <CardTitle className="flex items-center space-x-2">
-                    <FileText className="h-5 w-5" />
-                    <span>Raw Scope Input</span>
-                  </CardTitle>
-                  <CardDescription>
-                    Enter your company's scope, activities, and regulatory context in natural language
-                  </CardDescription>
-                </CardHeader>
-                <CardContent className="space-y-4">
-                  <div className="space-y-2">
-                    <Label htmlFor="raw-scope">Scope Description</Label>
-                    <Textarea
-                      id="raw-scope"
-                      placeholder="Enter your company scope, including activities, geographies, facilities, metrics, and timelines..."
-                      value={rawScope}
-                      onChange={(e) => setRawScope(e.target.value)}
-                      rows={8}
-                    />
-                  </div>
-                  
-                  <Alert>
-                    <Lightbulb className="h-4 w-4" />
-                    <AlertDescription>
-                      <strong>Tip:</strong> Include information about your company's main activities, operating regions, size, and any specific ESG frameworks you're considering.
-                    </AlertDescription>
-                  </Alert>
-
-                  <Button 
-                    onClick={handleAnalyzeScope} 
-                    disabled={!rawScope.trim() || isAnalyzing || !selectedProjectId}
-                    className="w-full"
-                  >
-                    {isAnalyzing ? (
-                      <>
-                        <Loader2 className="h-4 w-4 mr-2 animate-spin" />
-                        Analyzing Scope...
-                      </>
-                    ) : (
-                      <>
-                        <Target className="h-4 w-4 mr-2" />
-                        Analyze Scope
-                      </>
-                    )}
-                  </Button>
-                </CardContent>
-              </Card>
+              <ScopeInputCard
+                isAnalyzing={isAnalyzing}
+                canAnalyze={!!selectedProjectId}
+                onAnalyze={handleAnalyzeScope}
+              />
 
               {/* Auto-Parse Suggestions */}
               <Card>
@@ -893,17 +908,7 @@ export default function ProjectWorkspace() {
                               {[...Array(10)].map((_, col) => {
                                 const x = col + 1
                                 const y = 10 - row
-                                
-                                // Sample data points
-                                const dataPoints = [
-                                  { x: 8, y: 9, label: "Climate Change", size: "large" },
-                                  { x: 7, y: 8, label: "Data Privacy", size: "medium" },
-                                  { x: 9, y: 6, label: "Energy Use", size: "medium" },
-                                  { x: 6, y: 7, label: "Diversity", size: "small" },
-                                  { x: 5, y: 5, label: "Supply Chain", size: "small" }
-                                ]
-                                
-                                const point = dataPoints.find(p => p.x === x && p.y === y)
+                                const point = sampleMatrixPoints.get(`${x},${y}`)
                                 
                                 return (
                                   <div
@@ -1,7 +1,7 @@
 "use client"
 
 import Link from "next/link"
-import { useEffect, useMemo, useState } from "react"
+import { useEffect, useState } from "react"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
 import { Button } from "@/components/ui/button"
 import { FileText, Download, BarChart3, Loader2, Plus } from "lucide-react"
@@ -10,6 +10,7 @@ import { Alert, AlertDescription } from "@/components/ui/alert"
 import { Badge } from "@/components/ui/badge"
 import { ProtectedRoute } from "@/components/protected-route"
 import { useAuth } from "@/contexts/auth-context"
+import { apiFetch, apiGetCached, invalidateApiCache } from "@/lib/api-client"
 
 type Project = { id: string; name: string }
 type Report = {
@@ -29,23 +30,11 @@ export default function ReportsPage() {
   const [isGenerating, setIsGenerating] = useState(false)
   const [error, setError] = useState<string | null>(null)
 
-  const authHeaders = useMemo(() => {
-    const headers: Record<string, string> = {}
-    if (token) headers.Authorization = `Bearer ${token}`
-    return headers
-  }, [token])
-
   const loadProjects = async () => {
-    const response = await fetch('/api/v1/projects?limit=100', {
-      credentials: 'include',
-      headers: authHeaders
+    const data = await apiGetCached('/api/v1/projects?limit=100', {
+      token,
+      errorMessage: 'Failed to load projects'
     })
-
-    if (!response.ok) {
-      throw new Error('Failed to load projects')
-    }
-
-    const data = await response.json()
     const mappedProjects = (data.data || []).map((project: any) => ({
       id: project.id,
       name: project.name
@@ -55,10 +44,7 @@ export default function ReportsPage() {
 
   const loadReports = async (projectId?: string) => {
     const query = projectId && projectId !== 'all' ? `?projectId=${projectId}` : ''
-    const response = await fetch(`/api/v1/reports${query}`, {
-      credentials: 'include',
-      headers: authHeaders
-    })
+    const response = await apiFetch(`/api/v1/reports${query}`, { token })
 
     if (!response.ok) {
       throw new Error('Failed to load reports')
@@ -103,18 +89,14 @@ export default function ReportsPage() {
       setIsGenerating(true)
       setError(null)
 
-      const response = await fetch(`/api/v1/projects/${selectedProjectId}/report/generate`, {
+      const response = await apiFetch(`/api/v1/projects/${selectedProjectId}/report/generate`, {
+        token,
         method: 'POST',
-        credentials: 'include',
-        headers: {
-          'Content-Type': 'application/json',
-          ...authHeaders
-        },
-        body: JSON.stringify({
+        body: {
           format: 'json',
           includeXBRL: true,
           sections: ['executive_summary', 'environmental', 'social', 'governance']
-        })
+        }
       })
 
       if (!response.ok) {
@@ -122,6 +104,7 @@ export default function ReportsPage() {
         throw new Error(data.error || 'Failed to generate report')
       }
 
+      invalidateApiCache('/api/v1/reports')
       await loadReports(selectedProjectId)
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Unable to generate report')
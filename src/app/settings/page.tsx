@@ -1,7 +1,7 @@
 "use client"
 
 import Link from "next/link"
-import { useEffect, useMemo, useState } from "react"
+import { useEffect, useState } from "react"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
 import { Button } from "@/components/ui/button"
 import { Shield, Bell, UserCog, Loader2, LogOut } from "lucide-react"
@@ -11,6 +11,7 @@ import { Switch } from "@/components/ui/switch"
 import { Alert, AlertDescription } from "@/components/ui/alert"
 import { ProtectedRoute } from "@/components/protected-route"
 import { useAuth } from "@/contexts/auth-context"
+import { apiFetch } from "@/lib/api-client"
 
 type Preferences = {
   notifications?: {
@@ -35,20 +36,11 @@ export default function SettingsPage() {
   const [error, setError] = useState<string | null>(null)
   const [success, setSuccess] = useState<string | null>(null)
 
-  const authHeaders = useMemo(() => {
-    const headers: Record<string, string> = {}
-    if (token) headers.Authorization = `Bearer ${token}`
-    return headers
-  }, [token])
-
   useEffect(() => {
     const load = async () => {
       try {
         setIsLoading(true)
-        const response = await fetch('/api/v1/settings', {
-          credentials: 'include',
-          headers: authHeaders
-        })
+        const response = await apiFetch('/api/v1/settings', { token })
 
         if (!response.ok) {
           throw new Error('Failed to load settings')
@@ -78,14 +70,10 @@ export default function SettingsPage() {
       setError(null)
       setSuccess(null)
 
-      const response = await fetch('/api/v1/settings', {
+      const response = await apiFetch('/api/v1/settings', {
+        token,
         method: 'PUT',
-        credentials: 'include',
-        headers: {
-          'Content-Type': 'application/json',
-          ...authHeaders
-        },
-        body: JSON.stringify({ name, preferences })
+        body: { name, preferences }
       })
 
       if (!response.ok) {
@@ -1,6 +1,7 @@
 "use client"
 
 import { useState } from "react"
+import dynamic from "next/dynamic"
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "@/components/ui/card"
 import { Badge } from "@/components/ui/badge"
 import { Button } from "@/components/ui/button"
@@ -18,9 +19,18 @@ import {
   Copy,
   ExternalLink
 } from "lucide-react"
-import { SyntaxHighlighter } from "react-syntax-highlighter"
 import { docco } from "react-syntax-highlighter/dist/esm/styles/hljs"
 
+// The highlighter and its grammars are only needed for the XBRL source card,
+// so load them on demand instead of with the viewer bundle.
+const SyntaxHighlighter = dynamic(
+  () => import("react-syntax-highlighter").then((mod) => mod.default),
+  {
+    ssr: false,
+    loading: () => <p className="text-sm text-muted-foreground">Loading XBRL source...</p>
+  }
+)
+
 interface XBRLTag {
   concept: string
   contextRef: string
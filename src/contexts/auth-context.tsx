@@ -1,7 +1,8 @@
 'use client'
 
-import React, { createContext, useContext, useEffect, useState } from 'react'
+import React, { createContext, useCallback, useContext, useEffect, useMemo, useState } from 'react'
 import { UserRole } from '@prisma/client'
+import { invalidateApiCache } from '@/lib/api-client'
 
 interface User {
   id: string
@@ -62,7 +63,7 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
     }
   }
 
-  const login = async (email: string, password: string) => {
+  const login = useCallback(async (email: string, password: string) => {
     try {
       const response = await fetch('/api/v1/auth/login', {
         method: 'POST',
@@ -86,9 +87,9 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
       console.error('Login error:', error)
       return { success: false, error: 'Network error' }
     }
-  }
+  }, [])
 
-  const register = async (email: string, password: string, name: string, role?: UserRole) => {
+  const register = useCallback(async (email: string, password: string, name: string, role?: UserRole) => {
     try {
       const response = await fetch('/api/v1/auth/register', {
         method: 'POST',
@@ -112,9 +113,9 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
       console.error('Registration error:', error)
       return { success: false, error: 'Network error' }
     }
-  }
+  }, [])
 
-  const logout = async () => {
+  const logout = useCallback(async () => {
     try {
       await fetch('/api/v1/auth/logout', {
         method: 'POST',
@@ -123,29 +124,29 @@ export function AuthProvider({ children }: { children: React.ReactNode }) {
     } catch (error) {
       console.error('Logout error:', error)
     } finally {
+      invalidateApiCache()
       setUser(null)
       setToken(null)
     }
-  }
+  }, [])
 
-  const hasRole = (role: UserRole): boolean => {
+  const hasRole = useCallback((role: UserRole): boolean => {
     return user?.role === role
-  }
+  }, [user])
 
-  const isAuthenticated = !!user
-  const isAdmin = hasRole(UserRole.ADMIN)
-
-  const value: AuthContextType = {
+  // Keep the context value stable so consumers only re-render when auth
+  // state actually changes, not on every provider render.
+  const value = useMemo<AuthContextType>(() => ({
     user,
     token,
     login,
     register,
     logout,
     isLoading,
-    isAuthenticated,
+    isAuthenticated: !!user,
     hasRole,
-    isAdmin
-  }
+    isAdmin: user?.role === UserRole.ADMIN
+  }), [user, token, login, register, logout, isLoading, hasRole])
 
   return (
     <AuthContext.Provider value={value}>
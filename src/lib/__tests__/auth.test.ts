@@ -1,10 +1,13 @@
+import bcrypt from 'bcryptjs'
 import jwt from 'jsonwebtoken'
 import {
   hashPassword,
   verifyPassword,
+  passwordNeedsRehash,
   generateToken,
   verifyToken,
   extractTokenFromHeader,
+  extractTokenFromCookie,
 } from '../auth-utils'
 
 process.env.JWT_SECRET = 'test-super-secret-jwt-key-for-testing-only-32-chars'
@@ -48,6 +51,18 @@ describe('Authentication Utilities', () => {
     })
   })
 
+  describe('passwordNeedsRehash', () => {
+    it('should not flag hashes created with the current cost', async () => {
+      const hashedPassword = await hashPassword('testPassword123!')
+      expect(passwordNeedsRehash(hashedPassword)).toBe(false)
+    })
+
+    it('should flag hashes created with a different cost', () => {
+      const hashedPassword = bcrypt.hashSync('testPassword123!', 4)
+      expect(passwordNeedsRehash(hashedPassword)).toBe(true)
+    })
+  })
+
   describe('generateToken', () => {
     it('should generate a valid JWT token', () => {
       const payload = {
@@ -78,6 +93,23 @@ describe('Authentication Utilities', () => {
       expect(decoded).toMatchObject(payload)
     })
 
+    it('should return the cached payload for a previously verified token', () => {
+      const payload = {
+        userId: 'test-user-id',
+        email: 'test@example.com',
+        role: 'VIEWER' as const,
+      }
+
+      const token = generateToken(payload)
+      const first = verifyToken(token)
+      const verifySpy = jest.spyOn(jwt, 'verify')
+      const second = verifyToken(token)
+
+      expect(second).toBe(first)
+      expect(verifySpy).not.toHaveBeenCalled()
+      verifySpy.mockRestore()
+    })
+
     it('should reject invalid token', () => {
       const invalidToken = 'invalid.token.here'
       const decoded = verifyToken(invalidToken)
@@ -124,4 +156,23 @@ describe('Authentication Utilities', () => {
       expect(extracted).toBeNull()
     })
   })
+
+  describe('extractTokenFromCookie', () => {
+    it('should extract the auth_token cookie among others', () => {
+      const header = 'theme=dark; auth_token=test.jwt.token; locale=en'
+
+      const extracted = extractTokenFromCookie(header)
+      expect(extracted).toBe('test.jwt.token')
+    })
+
+    it('should not match cookies that only end in auth_token', () => {
+      const extracted = extractTokenFromCookie('old_auth_token=stale.jwt.token')
+      expect(extracted).toBeNull()
+    })
+
+    it('should return null for missing header', () => {
+      const extracted = extractTokenFromCookie(null)
+      expect(extracted).toBeNull()
+    })
+  })
 })
@@ -0,0 +1,22 @@
+import type ZAI from 'z-ai-web-dev-sdk'
+
+type ZAIClient = Awaited<ReturnType<typeof ZAI.create>>
+
+// ZAI.create() loads the SDK configuration; do it once per process and share
+// the client across requests. The SDK module itself is loaded on first use.
+let zaiClient: Promise<ZAIClient> | null = null
+
+export function getZAI(): Promise<ZAIClient> {
+  if (!zaiClient) {
+    const pending = import('z-ai-web-dev-sdk').then(({ default: sdk }) => sdk.create())
+    zaiClient = pending
+    pending.catch(() => {
+      if (zaiClient === pending) zaiClient = null
+    })
+  }
+  return zaiClient
+}
+
+export default {
+  getZAI,
+}
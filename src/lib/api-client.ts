@@ -0,0 +1,126 @@
+export interface ApiRequestOptions {
+  token?: string | null
+  method?: string
+  body?: unknown
+  signal?: AbortSignal
+}
+
+// Headers are built per call from the caller's token rather than kept on a
+// shared object, so concurrent requests never see each other's credentials.
+function buildHeaders(token?: string | null, hasBody = false): Record<string, string> {
+  const headers: Record<string, string> = {}
+  if (hasBody) headers['Content-Type'] = 'application/json'
+  if (token) headers.Authorization = `Bearer ${token}`
+  return headers
+}
+
+// Transient gateway/overload responses are retried for idempotent GETs only.
+const RETRYABLE_STATUSES = new Set([429, 502, 503, 504])
+const MAX_GET_RETRIES = 3
+const RETRY_BACKOFF_MS = 300
+
+const delay = (ms: number) => new Promise(resolve => setTimeout(resolve, ms))
+
+export async function apiFetch(path: string, options: ApiRequestOptions = {}): Promise<Response> {
+  const { token, method = 'GET', body, signal } = options
+  const hasBody = body !== undefined
+  const init: RequestInit = {
+    method,
+    credentials: 'include',
+    headers: buildHeaders(token, hasBody),
+    body: hasBody ? JSON.stringify(body) : undefined,
+    signal,
+  }
+
+  if (method !== 'GET') {
+    return fetch(path, init)
+  }
+
+  for (let attempt = 0; ; attempt++) {
+    let response: Response
+    try {
+      response = await fetch(path, init)
+    } catch (error) {
+      // Network failures (fetch rejects with a TypeError) get the same backoff
+      // as gateway errors; aborts and anything else surface immediately.
+      if (!(error instanceof TypeError) || attempt >= MAX_GET_RETRIES || signal?.aborted) {
+        throw error
+      }
+      await delay(RETRY_BACKOFF_MS * 2 ** attempt)
+      continue
+    }
+
+    if (!RETRYABLE_STATUSES.has(response.status) || attempt >= MAX_GET_RETRIES || signal?.aborted) {
+      return response
+    }
+    await delay(RETRY_BACKOFF_MS * 2 ** attempt)
+  }
+}
+
+// Read-only lists shared by several pages (dashboard, project, reports) are
+// memoized briefly so navigating between them does not refetch unchanged data.
+export const DEFAULT_CACHE_TTL_MS = 60_000
+
+interface CacheEntry {
+  expiresAt: number
+  data: Promise<any>
+}
+
+const responseCache = new Map<string, CacheEntry>()
+
+function cacheKey(path: string, token?: string | null): string {
+  return `${token || ''} ${path}`
+}
+
+export interface CachedGetOptions {
+  token?: string | null
+  ttlMs?: number
+  errorMessage?: string
+}
+
+export function apiGetCached<T = any>(path: string, options: CachedGetOptions = {}): Promise<T> {
+  const { token, ttlMs = DEFAULT_CACHE_TTL_MS, errorMessage = 'Request failed' } = options
+  const key = cacheKey(path, token)
+  const now = Date.now()
+  const cached = responseCache.get(key)
+
+  if (cached && cached.expiresAt > now) {
+    return cached.data
+  }
+
+  const data = apiFetch(path, { token }).then(async (response) => {
+    if (!response.ok) {
+      throw new Error(errorMessage)
+    }
+    return response.json()
+  })
+
+  responseCache.set(key, { expiresAt: now + ttlMs, data })
+  data.catch(() => {
+    if (responseCache.get(key)?.data === data) {
+      responseCache.delete(key)
+    }
+  })
+
+  return data
+}
+
+// Drop cached GETs whose path starts with the prefix, e.g. after a mutation.
+export function invalidateApiCache(pathPrefix?: string): void {
+  if (!pathPrefix) {
+    responseCache.clear()
+    return
+  }
+
+  for (const key of responseCache.keys()) {
+    if (key.slice(key.indexOf(' ') + 1).startsWith(pathPrefix)) {
+      responseCache.delete(key)
+    }
+  }
+}
+
+export default {
+  apiFetch,
+  apiGetCached,
+  invalidateApiCache,
+}
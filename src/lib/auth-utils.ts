@@ -29,13 +29,42 @@ export async function verifyPassword(password: string, hashedPassword: string):
   return bcrypt.compare(password, hashedPassword)
 }
 
+// Hashes created under an older cost factor are upgraded on the next
+// successful login, so SALT_ROUNDS can be tuned without a bulk migration.
+export function passwordNeedsRehash(hashedPassword: string): boolean {
+  try {
+    return bcrypt.getRounds(hashedPassword) !== SALT_ROUNDS
+  } catch (error) {
+    return true
+  }
+}
+
 export function generateToken(payload: JWTPayload): string {
   return jwt.sign(payload, JWT_SECRET, { expiresIn: JWT_EXPIRES_IN })
 }
 
+// Every authenticated request re-verifies the same bearer token, so keep a
+// small cache of verified payloads until their own expiry.
+const VERIFIED_TOKEN_CACHE_SIZE = 1000
+const verifiedTokenCache = new Map<string, JWTPayload & { exp?: number }>()
+
 export function verifyToken(token: string): JWTPayload | null {
+  const cached = verifiedTokenCache.get(token)
+  if (cached) {
+    if (!cached.exp || cached.exp * 1000 > Date.now()) {
+      return cached
+    }
+    verifiedTokenCache.delete(token)
+  }
+
   try {
-    return jwt.verify(token, JWT_SECRET) as JWTPayload
+    const payload = jwt.verify(token, JWT_SECRET) as JWTPayload & { exp?: number }
+    if (verifiedTokenCache.size >= VERIFIED_TOKEN_CACHE_SIZE) {
+      const oldest = verifiedTokenCache.keys().next().value
+      if (oldest !== undefined) verifiedTokenCache.delete(oldest)
+    }
+    verifiedTokenCache.set(token, payload)
+    return payload
   } catch (error) {
     return null
   }
@@ -48,14 +77,14 @@ export function extractTokenFromHeader(authHeader: string | undefined): string |
   return authHeader.substring(7)
 }
 
+// Matches the auth_token cookie anywhere in the header in a single scan,
+// instead of splitting and trimming every cookie on each request.
+const AUTH_COOKIE_PATTERN = /(?:^|;)\s*auth_token=([^;]*)/
+
 export function extractTokenFromCookie(cookieHeader: string | null | undefined): string | null {
   if (!cookieHeader) return null
 
-  const tokenCookie = cookieHeader
-    .split(';')
-    .map(part => part.trim())
-    .find(part => part.startsWith('auth_token='))
-
-  if (!tokenCookie) return null
-  return decodeURIComponent(tokenCookie.split('=')[1] || '')
+  const match = AUTH_COOKIE_PATTERN.exec(cookieHeader)
+  if (!match) return null
+  return decodeURIComponent(match[1].trim())
 }
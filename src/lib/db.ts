@@ -4,10 +4,38 @@ const globalForPrisma = globalThis as unknown as {
   prisma: PrismaClient | undefined
 }
 
+// Pool sizing is tunable per deployment without editing DATABASE_URL;
+// parameters already present in the URL take precedence.
+function resolveDatasourceUrl(): string | undefined {
+  const url = process.env.DATABASE_URL
+  const poolParams: Array<[string, string | undefined]> = [
+    ['connection_limit', process.env.DB_POOL_SIZE],
+    ['pool_timeout', process.env.DB_POOL_TIMEOUT],
+  ]
+
+  if (!url || !poolParams.some(([, value]) => value)) return url
+
+  const parsed = new URL(url)
+  for (const [key, value] of poolParams) {
+    if (value && !parsed.searchParams.has(key)) parsed.searchParams.set(key, value)
+  }
+  return parsed.toString()
+}
+
+const datasourceUrl = resolveDatasourceUrl()
+
+// Query logging formats and prints every statement, so keep it to development
+// unless explicitly requested; warnings and errors are always emitted.
+const logQueries =
+  process.env.NODE_ENV === 'development' || process.env.DB_LOG_QUERIES === 'true'
+
 export const db =
   globalForPrisma.prisma ??
   new PrismaClient({
-    log: ['query'],
+    log: logQueries ? ['query', 'warn', 'error'] : ['warn', 'error'],
+    ...(datasourceUrl && { datasourceUrl }),
   })
 
-if (process.env.NODE_ENV !== 'production') globalForPrisma.prisma = db
\ No newline at end of file
+// Cache in every environment: route bundles and the custom server can load
+// this module more than once, and each PrismaClient owns its own pool.
+globalForPrisma.prisma = db
@@ -66,11 +66,52 @@ export class APIError extends Error {
       timestamp: this.timestamp.toISOString(),
       requestId: this.requestId,
       userId: this.userId,
-      stack: process.env.NODE_ENV === 'development' ? this.stack : undefined,
+      // Expected client errors (4xx) never need a trace
+      stack: process.env.NODE_ENV === 'development' && this.statusCode >= 500
+        ? this.stack
+        : undefined,
     }
   }
 }
 
+// Records below LOG_LEVEL return before any entry is built or serialized.
+// Defaults to info in production and debug everywhere else.
+const LEVEL_SEVERITY: Record<LogLevel, number> = {
+  [LogLevel.ERROR]: 0,
+  [LogLevel.WARN]: 1,
+  [LogLevel.INFO]: 2,
+  [LogLevel.DEBUG]: 3,
+}
+
+function resolveLogThreshold(): number {
+  const configured = process.env.LOG_LEVEL?.toLowerCase() as LogLevel | undefined
+  if (configured && configured in LEVEL_SEVERITY) return LEVEL_SEVERITY[configured]
+  return process.env.NODE_ENV === 'production'
+    ? LEVEL_SEVERITY[LogLevel.INFO]
+    : LEVEL_SEVERITY[LogLevel.DEBUG]
+}
+
+const logThreshold = resolveLogThreshold()
+
+// Development log prefixes, built once per level rather than per record.
+// Colours are only emitted to a terminal so redirected output stays plain.
+const useColors = Boolean(process.stdout?.isTTY)
+const LEVEL_COLORS: Record<LogLevel, string> = {
+  [LogLevel.ERROR]: '\x1b[31m', // Red
+  [LogLevel.WARN]: '\x1b[33m',  // Yellow
+  [LogLevel.INFO]: '\x1b[36m',  // Cyan
+  [LogLevel.DEBUG]: '\x1b[37m', // White
+}
+const RESET_COLOR = '\x1b[0m'
+const LEVEL_PREFIXES = Object.fromEntries(
+  Object.values(LogLevel).map(level => [
+    level,
+    useColors
+      ? `${LEVEL_COLORS[level]}[${level.toUpperCase()}]${RESET_COLOR} `
+      : `[${level.toUpperCase()}] `,
+  ])
+) as Record<LogLevel, string>
+
 // Structured logger
 export class Logger {
   private context: string
@@ -86,7 +127,21 @@ export class Logger {
     this.userId = userId
   }
 
+  // Per-request child logger, so concurrent requests sharing a module-level
+  // logger never overwrite each other's requestId/userId.
+  withRequestContext(requestId: string, userId?: string): Logger {
+    const child = new Logger(this.context)
+    child.setRequestContext(requestId, userId)
+    return child
+  }
+
+  isLevelEnabled(level: LogLevel): boolean {
+    return LEVEL_SEVERITY[level] <= logThreshold
+  }
+
   private log(level: LogLevel, message: string, meta?: any) {
+    if (!this.isLevelEnabled(level)) return
+
     const logEntry = {
       timestamp: new Date().toISOString(),
       level,
@@ -103,17 +158,8 @@ export class Logger {
       console.log(JSON.stringify(logEntry))
     } else {
       // Development logging with colors
-      const colors = {
-        [LogLevel.ERROR]: '\x1b[31m', // Red
-        [LogLevel.WARN]: '\x1b[33m',  // Yellow
-        [LogLevel.INFO]: '\x1b[36m',  // Cyan
-        [LogLevel.DEBUG]: '\x1b[37m', // White
-      }
-      const reset = '\x1b[0m'
-      
       console.log(
-        `${colors[level]}[${level.toUpperCase()}]${reset} ` +
-        `${this.context}: ${message}`,
+        `${LEVEL_PREFIXES[level]}${this.context}: ${message}`,
         meta || ''
       )
     }
@@ -137,9 +183,11 @@ export class Logger {
 
   // Structured logging methods
   logError(error: Error, context?: string) {
+    // V8 formats stack traces lazily on first access. APIError.toJSON already
+    // decides whether its stack is logged, so only read it for other errors.
     this.error(error.message, {
       context,
-      stack: error.stack,
+      stack: error instanceof APIError ? undefined : error.stack,
       name: error.name,
       ...(error instanceof APIError && error.toJSON()),
     })
@@ -147,9 +195,9 @@ export class Logger {
 
   logAPIRequest(req: NextRequest, userId?: string) {
     const requestId = this.generateRequestId()
-    this.setRequestContext(requestId, userId)
+    if (!this.isLevelEnabled(LogLevel.INFO)) return requestId
 
-    this.info('API Request', {
+    this.withRequestContext(requestId, userId).info('API Request', {
       method: req.method,
       url: req.url,
       userAgent: req.headers.get('user-agent'),
@@ -196,6 +244,19 @@ export class Logger {
   }
 }
 
+// One base logger per error context, reused across calls; request details
+// go on a short-lived child so shared instances are never mutated.
+const contextLoggers = new Map<string, Logger>()
+
+function getContextLogger(context: string): Logger {
+  let logger = contextLoggers.get(context)
+  if (!logger) {
+    logger = new Logger(context)
+    contextLoggers.set(context, logger)
+  }
+  return logger
+}
+
 // Error handler utility
 export function handleApiError(
   error: unknown,
@@ -203,11 +264,8 @@ export function handleApiError(
   requestId?: string,
   userId?: string
 ): NextResponse {
-  const logger = new Logger(context)
-  
-  if (requestId) {
-    logger.setRequestContext(requestId, userId)
-  }
+  const baseLogger = getContextLogger(context)
+  const logger = requestId ? baseLogger.withRequestContext(requestId, userId) : baseLogger
 
   if (error instanceof APIError) {
     logger.logError(error, context)
@@ -353,9 +411,10 @@ export function withRequestTiming<T extends any[], R>(
     
     try {
       const result = await handler(...args)
-      const duration = Date.now() - startTime
-      
-      logger.debug('Request completed', { duration: `${duration}ms` })
+      if (logger.isLevelEnabled(LogLevel.DEBUG)) {
+        const duration = Date.now() - startTime
+        logger.debug('Request completed', { duration: `${duration}ms` })
+      }
       
       return result
     } catch (error) {
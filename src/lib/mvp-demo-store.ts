@@ -1,3 +1,4 @@
+import { randomUUID } from 'crypto'
 import { UserRole } from '@prisma/client'
 
 export interface DemoUser {
@@ -105,7 +106,7 @@ export function createDemoProject(input: { name: string; organisationId: string;
   const now = new Date().toISOString()
   const store = getDemoStore()
   const project: DemoProject = {
-    id: `demo-project-${store.projects.length + 1}`,
+    id: `demo-project-${randomUUID()}`,
     name: input.name,
     organisationId: input.organisationId,
     organisationName: 'ESG Pathfinder Demo Org',
@@ -141,7 +142,7 @@ export function createDemoReport(input: { projectId: string; contentJson: unknow
   const reportsForProject = store.reports.filter((r) => r.projectId === input.projectId)
   const version = reportsForProject.length ? Math.max(...reportsForProject.map((r) => r.version)) + 1 : 1
   const report: DemoReport = {
-    id: `demo-report-${store.reports.length + 1}`,
+    id: `demo-report-${randomUUID()}`,
     projectId: input.projectId,
     version,
     generatedAt: new Date().toISOString(),
@@ -20,24 +20,38 @@ const defaultConfig: RateLimitConfig = {
   skipFailedRequests: false,
 }
 
+// Keys are memoized per request so the limiter and the response-header pass
+// in withRateLimit share one SHA-256 computation.
+const requestKeyCache = new WeakMap<NextRequest, Map<string, string>>()
+
 // Generate a unique key for rate limiting
 function getRateLimitKey(req: NextRequest, identifier?: string): string {
+  const userId = identifier || 'anonymous'
+  let keysForRequest = requestKeyCache.get(req)
+  const cachedKey = keysForRequest?.get(userId)
+  if (cachedKey) return cachedKey
+
   const ip = req.ip || 
              req.headers.get('x-forwarded-for')?.split(',')[0] || 
              req.headers.get('x-real-ip') || 
              'unknown'
   
   const userAgent = req.headers.get('user-agent') || 'unknown'
-  const userId = identifier || 'anonymous'
   
   // Create a hash of IP + User Agent + User ID for better uniqueness
   const keyData = `${ip}:${userAgent}:${userId}`
-  return createHash('sha256').update(keyData).digest('hex').substring(0, 16)
+  const key = createHash('sha256').update(keyData).digest('hex').substring(0, 16)
+
+  if (!keysForRequest) {
+    keysForRequest = new Map()
+    requestKeyCache.set(req, keysForRequest)
+  }
+  keysForRequest.set(userId, key)
+  return key
 }
 
 // Clean up expired entries
-function cleanupExpiredEntries(): void {
-  const now = Date.now()
+function cleanupExpiredEntries(now: number = Date.now()): void {
   for (const [key, value] of rateLimitStore.entries()) {
     if (now > value.resetTime) {
       rateLimitStore.delete(key)
@@ -50,13 +64,14 @@ export function createRateLimit(config: Partial<RateLimitConfig> = {}) {
   const finalConfig = { ...defaultConfig, ...config }
 
   const limiter = function rateLimit(req: NextRequest, identifier?: string): NextResponse | null {
+    const now = Date.now()
+
     // Clean up expired entries periodically
     if (Math.random() < 0.01) { // 1% chance to cleanup
-      cleanupExpiredEntries()
+      cleanupExpiredEntries(now)
     }
 
     const key = getRateLimitKey(req, identifier)
-    const now = Date.now()
     
     // Get or create rate limit entry
     let entry = rateLimitStore.get(key)
@@ -200,11 +215,11 @@ export function blockIP(ip: string, durationMs: number, reason: string): void {
   })
 }
 
-export function isIPBlocked(ip: string): { blocked: boolean; reason?: string; until?: number } {
+export function isIPBlocked(ip: string, now: number = Date.now()): { blocked: boolean; reason?: string; until?: number } {
   const block = blockedIPs.get(ip)
   if (!block) return { blocked: false }
   
-  if (Date.now() > block.until) {
+  if (now > block.until) {
     blockedIPs.delete(ip)
     return { blocked: false }
   }
@@ -35,7 +35,25 @@ function getMissing(required: Array<{ key: string; ok: boolean }>): string[] {
   return required.filter(item => !item.ok).map(item => item.key)
 }
 
+// Every code prefix the requirements below test for
+const DATA_POINT_PREFIXES = ['GRI_', 'SASB_', 'RJC_COC_', 'RJC_HR_', 'RJC_ENV_', 'VSME_B_', 'VSME_C_', 'VSME_', 'IFRS_']
+
+// Index the data point codes in a single pass so each requirement is a set
+// lookup instead of its own scan over the list.
+function indexDataPointCodes(codes: string[]) {
+  const prefixes = new Set<string>()
+  for (const code of codes) {
+    for (const prefix of DATA_POINT_PREFIXES) {
+      if (code.startsWith(prefix)) prefixes.add(prefix)
+    }
+  }
+  return { codes: new Set(codes), prefixes }
+}
+
 export function buildStandardsReadiness(input: BuildInput): StandardReadiness[] {
+  const { codes, prefixes } = indexDataPointCodes(input.dataPointCodes)
+  const frameworks = new Set(input.complianceFrameworks)
+
   const tcfdReq = [
     { key: 'Governance disclosures', ok: !!input.tcfd?.governance },
     { key: 'Strategy disclosures', ok: !!input.tcfd?.strategy },
@@ -65,7 +83,7 @@ export function buildStandardsReadiness(input: BuildInput): StandardReadiness[]
     { key: 'Topic standards', ok: !!input.gri?.topicStandards },
     { key: 'Materiality disclosures', ok: !!input.gri?.materiality },
     { key: 'Disclosure index', ok: !!input.gri?.disclosures },
-    { key: 'GRI tagged datapoints', ok: input.dataPointCodes.some(c => c.startsWith('GRI_')) }
+    { key: 'GRI tagged datapoints', ok: prefixes.has('GRI_') }
   ]
 
   const sasbReq = [
@@ -73,33 +91,33 @@ export function buildStandardsReadiness(input: BuildInput): StandardReadiness[]
     { key: 'Industry standard mapping', ok: !!input.sasb?.standards },
     { key: 'Metrics and calculations', ok: !!input.sasb?.metrics },
     { key: 'Disclosure records', ok: !!input.sasb?.disclosures },
-    { key: 'SASB tagged datapoints', ok: input.dataPointCodes.some(c => c.startsWith('SASB_')) }
+    { key: 'SASB tagged datapoints', ok: prefixes.has('SASB_') }
   ]
 
 
   const rjcReq = [
-    { key: 'RJC governance & ethics policy', ok: input.complianceFrameworks.includes('RJC') },
-    { key: 'Chain of custody controls', ok: input.dataPointCodes.some(c => c.startsWith('RJC_COC_')) },
-    { key: 'Human rights and labor controls', ok: input.dataPointCodes.some(c => c.startsWith('RJC_HR_')) },
-    { key: 'Environmental management controls', ok: input.dataPointCodes.some(c => c.startsWith('RJC_ENV_')) },
+    { key: 'RJC governance & ethics policy', ok: frameworks.has('RJC') },
+    { key: 'Chain of custody controls', ok: prefixes.has('RJC_COC_') },
+    { key: 'Human rights and labor controls', ok: prefixes.has('RJC_HR_') },
+    { key: 'Environmental management controls', ok: prefixes.has('RJC_ENV_') },
     { key: 'Corrective action workflow/evidence', ok: input.workflowCount > 0 && input.evidenceCount > 0 }
   ]
 
 
   const vsmeReq = [
-    { key: 'Basic module narrative', ok: input.dataPointCodes.some(c => c.startsWith('VSME_B_')) },
-    { key: 'Comprehensive module narrative', ok: input.dataPointCodes.some(c => c.startsWith('VSME_C_')) },
-    { key: 'VSME disclosures tracked', ok: input.dataPointCodes.some(c => c.startsWith('VSME_')) },
-    { key: 'VSME compliance workflow', ok: input.complianceFrameworks.includes('VSME') || input.workflowCount > 0 },
+    { key: 'Basic module narrative', ok: prefixes.has('VSME_B_') },
+    { key: 'Comprehensive module narrative', ok: prefixes.has('VSME_C_') },
+    { key: 'VSME disclosures tracked', ok: prefixes.has('VSME_') },
+    { key: 'VSME compliance workflow', ok: frameworks.has('VSME') || input.workflowCount > 0 },
     { key: 'Supporting evidence', ok: input.evidenceCount > 0 }
   ]
 
   const ifrsReq = [
     { key: 'IFRS S1/S2 readiness', ok: !!input.issb?.ifrsS1 && !!input.issb?.ifrsS2 },
-    { key: 'IFRS metric datapoints', ok: input.dataPointCodes.some(c => c.startsWith('IFRS_')) },
-    { key: 'Climate metrics (Scope 1/2)', ok: input.dataPointCodes.includes('IFRS_S2_5') && input.dataPointCodes.includes('IFRS_S2_6') },
-    { key: 'Financial impact inputs', ok: input.dataPointCodes.includes('IFRS_S2_8') || input.dataPointCodes.includes('IFRS_S2_10') },
-    { key: 'Compliance workflow', ok: input.complianceFrameworks.includes('ISSB') || input.complianceFrameworks.includes('IFRS') }
+    { key: 'IFRS metric datapoints', ok: prefixes.has('IFRS_') },
+    { key: 'Climate metrics (Scope 1/2)', ok: codes.has('IFRS_S2_5') && codes.has('IFRS_S2_6') },
+    { key: 'Financial impact inputs', ok: codes.has('IFRS_S2_8') || codes.has('IFRS_S2_10') },
+    { key: 'Compliance workflow', ok: frameworks.has('ISSB') || frameworks.has('IFRS') }
   ]
 
   const standards: Array<{ standard: StandardName; req: Array<{ key: string; ok: boolean }>; inputs: string[]; supported: boolean }> = [
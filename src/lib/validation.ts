@@ -1,15 +1,20 @@
 import { z } from 'zod'
 
+const HTML_ESCAPE_PATTERN = /[<>"'\/]/g
+const HTML_ESCAPES: Record<string, string> = {
+  '<': '&lt;',
+  '>': '&gt;',
+  '"': '&quot;',
+  "'": '&#x27;',
+  '/': '&#x2F;',
+}
+
 // XSS protection utility
 export function sanitizeHtml(input: string): string {
   if (typeof input !== 'string') return input
   
-  return input
-    .replace(/</g, '&lt;')
-    .replace(/>/g, '&gt;')
-    .replace(/"/g, '&quot;')
-    .replace(/'/g, '&#x27;')
-    .replace(/\//g, '&#x2F;')
+  // Single pass over the input instead of one replace() per character
+  return input.replace(HTML_ESCAPE_PATTERN, char => HTML_ESCAPES[char])
 }
 
 // SQL injection protection for common patterns
@@ -110,6 +110,11 @@ export const querySchemas = {
     page: z.string().transform(Number).pipe(z.number().int().min(1)).default('1'),
     limit: z.string().transform(Number).pipe(z.number().int().min(1).max(100)).default('20'),
   }),
+
+  auditLogs: z.object({
+    page: z.string().transform(Number).pipe(z.number().int().min(1)).default('1'),
+    limit: z.string().transform(Number).pipe(z.number().int().min(1).max(100)).default('50'),
+  }),
 }
 
 export type LoginInput = z.infer<typeof loginSchema>